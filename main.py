@@ -1,32 +1,52 @@
 import os
-import shutil
 import sys
 import re
 import json
 import struct
+import codecs
+import mmap
 import html
+import hashlib
+import io
+import contextlib
+import tempfile
+import time
 from pathlib import Path
 from PySide6.QtGui import QIcon
-from collections import OrderedDict, defaultdict, Counter
-from functools import cmp_to_key
-from typing import List
+from collections import OrderedDict, defaultdict, Counter, deque, namedtuple
+from functools import lru_cache
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
 
-from PySide6.QtCore import QObject, QThread
-from PySide6.QtCore import Qt, QTimer, QRect, Signal, QPoint, QPointF, QTranslator, QLibraryInfo
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import chardet
+except ImportError:
+    chardet = None
+
+from PySide6.QtCore import QObject, QThread, QRunnable, QThreadPool
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QStringListModel, QTimer, QRect, Signal, QPoint, QPointF, QTranslator, QLibraryInfo
 from PySide6.QtGui import (
     QPalette, QColor, QAction, QGuiApplication, QFont,
-    QPixmap, QPainter, QImage, QFontDatabase, QCursor, QFontMetrics
+    QPixmap, QPainter, QImage, QFontDatabase, QCursor, QFontMetrics,
+    QStandardItemModel, QStandardItem
 )
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QDockWidget, QListWidget, QTableWidget, QTableWidgetItem,
+    QApplication, QMainWindow, QDockWidget, QListWidget,
     QFileDialog, QLineEdit, QMessageBox, QVBoxLayout, QWidget, QMenuBar, QMenu,
     QStatusBar, QPushButton, QHBoxLayout, QLabel, QInputDialog, QTextEdit, QDialog,
     QDialogButtonBox, QAbstractItemView, QHeaderView, QCheckBox, QComboBox, QFontDialog,
     QScrollArea, QSizePolicy, QGroupBox, QFrame, QProgressDialog, QSplitter,
-    QListWidgetItem, QTabWidget, QFormLayout, QProgressBar, QStyle, QTreeWidget, QTreeWidgetItem
+    QListWidgetItem, QTabWidget, QFormLayout, QProgressBar, QStyle, QTreeView,
+    QTableView, QButtonGroup
 )
 
 try:
@@ -36,7 +56,7 @@ try:
     from SAGXT import SAGXT, gta_sa_hash
     from LCGXT import LCGXT
     import gta5_gxt2
-    from GTA4_WHM_Text_Extractor import CHtmlTextExport, WhmTextData
+    from GTA4_WHM_Text_Extractor import CHtmlTextExport, WhmTextData, ExportedTextEntry
 except ImportError as e:
     print(f"警告：缺少依赖项，部分功能可能无法使用 - {e}")
     class MockGxtParser:
@@ -81,8 +101,165 @@ except ImportError as e:
         class WhmTextData:
             def __init__(self): self.hash = 0; self.offset = 0
     CHtmlTextExport, WhmTextData = MockWhm.CHtmlTextExport, MockWhm.WhmTextData
+    ExportedTextEntry = namedtuple('ExportedTextEntry', 'hash str')
+
+
+# 缓存放在本程序专用的子目录中；文件头带格式版本号，格式变化后旧缓存一律作废
+_WHM_CACHE_DIR = Path(tempfile.gettempdir()) / "GXTEditor" / "whm_cache"
+_WHM_CACHE_MAGIC = b'WHMC'
+_WHM_CACHE_VERSION = 1
+_WHM_CACHE_HEADER = struct.Struct('<4sHqI')
+_WHM_CACHE_ENTRY = struct.Struct('<II')
+# 缓存目录的总大小和单个文件的保留时间上限
+_WHM_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_WHM_CACHE_MAX_AGE = 30 * 24 * 3600
+
 
+def _whm_cache_path(path_str):
+    name = hashlib.blake2b(os.path.abspath(path_str).encode('utf-8'), digest_size=16).hexdigest()
+    return _WHM_CACHE_DIR / f"{name}.whm.cache"
 
+
+def _load_whm_disk_cache(path_str, mtime_ns):
+    """读取磁盘缓存，修改时间不一致或格式不符时返回 None"""
+    cache_path = _whm_cache_path(path_str)
+    try:
+        data = cache_path.read_bytes()
+    except OSError:
+        return None
+    entries = _parse_whm_disk_cache(data, mtime_ns)
+    if entries is None:
+        # 过期、版本不符或已损坏的缓存直接删除，不留在缓存目录中
+        with contextlib.suppress(OSError):
+            cache_path.unlink()
+        return None
+    # 刷新修改时间，清理时按最近使用顺序淘汰
+    with contextlib.suppress(OSError):
+        os.utime(cache_path)
+    return entries
+
+
+def _parse_whm_disk_cache(data, mtime_ns):
+    """校验并解析缓存内容，任何不符都返回 None"""
+    try:
+        magic, version, cached_mtime, count = _WHM_CACHE_HEADER.unpack_from(data, 0)
+        if magic != _WHM_CACHE_MAGIC or version != _WHM_CACHE_VERSION or cached_mtime != mtime_ns:
+            return None
+        entries = []
+        size = len(data)
+        offset = _WHM_CACHE_HEADER.size
+        for _ in range(count):
+            hash_val, length = _WHM_CACHE_ENTRY.unpack_from(data, offset)
+            offset += _WHM_CACHE_ENTRY.size
+            # 文件被截断或损坏时不能切出越界的空内容
+            if offset + length > size:
+                return None
+            entries.append(ExportedTextEntry(hash=hash_val, str=data[offset:offset + length]))
+            offset += length
+        if offset != size:
+            return None
+    except struct.error:
+        return None
+    return tuple(entries)
+
+
+def _prune_whm_disk_cache():
+    """删除过期的缓存文件，总大小超出上限时从最久未用的开始删除"""
+    try:
+        files = []
+        for entry in os.scandir(_WHM_CACHE_DIR):
+            if entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                files.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+    files.sort()
+    total = sum(size for _, size, _ in files)
+    expire = time.time() - _WHM_CACHE_MAX_AGE
+    for mtime, size, path in files:
+        if mtime >= expire and total <= _WHM_CACHE_MAX_BYTES:
+            break
+        with contextlib.suppress(OSError):
+            os.remove(path)
+            total -= size
+
+
+def _save_whm_disk_cache(path_str, mtime_ns, container):
+    parts = [_WHM_CACHE_HEADER.pack(_WHM_CACHE_MAGIC, _WHM_CACHE_VERSION, mtime_ns, len(container))]
+    for entry in container:
+        parts.append(_WHM_CACHE_ENTRY.pack(entry.hash, len(entry.str)))
+        parts.append(entry.str)
+    cache_path = _whm_cache_path(path_str)
+    # 先写临时文件再替换，中途失败或并发写入都不会留下半个缓存文件
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        _WHM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(b''.join(parts))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        return
+    _prune_whm_disk_cache()
+
+
+@lru_cache(maxsize=64)
+def _extract_whm_cached(path_str, mtime_ns):
+    """按路径和修改时间缓存 WHM 文件的解析结果（内存 + 磁盘两级）"""
+    container = _load_whm_disk_cache(path_str, mtime_ns)
+    if container is None:
+        container = tuple(CHtmlTextExport().ExtractWhmStrings(Path(path_str), set()))
+        if container:
+            _save_whm_disk_cache(path_str, mtime_ns, container)
+    return container
+
+
+def _iter_files(root, suffix):
+    """用 os.scandir 递归遍历目录，返回指定后缀文件的路径字符串"""
+    suffix = suffix.lower()
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(suffix):
+                    yield entry.path
+
+
+def _export_whm_to(path, output_txt_path):
+    """导出单个WHM文件到指定TXT路径，返回 (文件名, 是否导出, 错误信息)"""
+    name = os.path.basename(path)
+    try:
+        exporter = CHtmlTextExport()
+        container = exporter.ExtractWhmStrings(Path(path), set())
+        if not container:
+            return name, False, None
+        exporter.ExportText(output_txt_path, container)
+        return name, True, None
+    except Exception as e:
+        return name, False, str(e)
+
+
+def _export_one(path, out_dir):
+    """导出单个WHM文件到目标文件夹"""
+    name = os.path.basename(path)
+    return _export_whm_to(path, os.path.join(out_dir, os.path.splitext(name)[0] + ".txt"))
+
+
+def _export_whm_logged(path, output_txt_path):
+    """在子进程中导出单个WHM文件，同时收集解析器输出的提示信息"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        result = _export_whm_to(path, output_txt_path)
+    return result, output.getvalue()
+
+
+@lru_cache(maxsize=16)
 def _get_key_validation_message(version, file_type='gxt'):
     if version == 'VC': return "VC键名必须是1-7位数字、字母或下划线"
     if version == 'SA': return "SA键名必须是明文(自动Hash)，或是Hex(0x.../8位内)"
@@ -92,20 +269,110 @@ def _get_key_validation_message(version, file_type='gxt'):
     return "键名格式不正确"
 
 
-def _validate_key_static(key, version, file_type='gxt'):
+_HEX_KEY_RE = re.compile(r'0[xX]([0-9a-fA-F]{8})\Z')
+_TBL_NAME_RE = re.compile(r'[0-9a-zA-Z_]{1,7}\Z')
+_INVALID_FILENAME_RE = re.compile(r'[\\/:*?"<>|]')
+# 这些版本的键名规则本身就接受 0x 加 8 位十六进制
+_HEX_KEY_VERSIONS = frozenset(('SA', 'IV', 'V', 'WHM'))
+
+
+def _normalize_key(s):
+    """规范化键名，返回 (键名, 是否为十六进制键)"""
+    m = _HEX_KEY_RE.match(s)
+    if m:
+        return "0x" + m.group(1).upper(), True
+    return s.upper(), False
+
+
+def _hex_keys(hashes):
+    """把一组哈希值批量格式化为 0xXXXXXXXX 键名列表"""
+    hashes = tuple(hashes)
+    # 一次 % 格式化整段再切分，比逐个 f-string 少一轮解释器循环
+    keys = ("0x%08X\n" * len(hashes) % hashes).split('\n')
+    keys.pop()
+    return keys
+
+
+# chardet 猜测结果中可以采信的多字节编码
+_CHARDET_CJK_ENCODINGS = frozenset((
+    'gb18030', 'big5', 'euc-tw', 'shift_jis', 'cp932', 'euc-jp', 'euc-kr', 'cp949',
+))
+
+
+def _read_txt_file(path):
+    """
+    读取文本文件并返回解码后的内容，所有编码都失败时返回 None。
+    尝试顺序：UTF-8（可带 BOM）→ GBK → chardet 猜测的其他中日韩多字节编码（已安装时）
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    for encoding in ('utf-8-sig', 'gbk'):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    
+    # 带 BOM 的一定是 UTF-8，无需再猜；单字节编码能解码任何内容，只接受高置信度的多字节编码
+    if chardet is None or raw.startswith(codecs.BOM_UTF8):
+        return None
+    result = chardet.detect(raw[:4096])
+    guess = (result.get('encoding') or '').lower()
+    if guess not in _CHARDET_CJK_ENCODINGS or (result.get('confidence') or 0) < 0.8:
+        return None
+    try:
+        return raw.decode(guess)
+    except UnicodeDecodeError:
+        return None
+
+
+# GTA4 哈希是逐字符的纯 Python 计算，导入和保存时反复出现的键名直接取缓存
+_gta4_hash_cached = lru_cache(maxsize=1 << 16)(gta4_gxt_hash)
+
+
+def _encode_key_iv(key):
+    """GTA4 / WHM 键名转哈希值，0x 开头的按十六进制解析"""
+    if key.startswith(('0x', '0X')):
+        return int(key, 16)
+    return _gta4_hash_cached(key)
+
+
+def _encode_key_v(key):
+    """GTA5 键名转哈希值，0x 开头的按十六进制解析"""
+    if key.startswith(('0x', '0X')):
+        return int(key, 16)
+    return gta5_gxt2.joaat(key)
+
+
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+def _encode_key_sa(key):
+    """GTA SA 键名转哈希值，0x 开头或不超过 8 位的纯十六进制按数值解析"""
+    if key.startswith(('0x', '0X')) or (len(key) <= 8 and _HEX_DIGITS.issuperset(key)):
+        return int(key, 16)
+    return gta_sa_hash(key)
+
+
+# 保存时各版本的键名编码函数
+_KEY_ENCODERS = {'IV': _encode_key_iv, 'V': _encode_key_v, 'SA': _encode_key_sa}
+
+
+@lru_cache(maxsize=16)
+def _key_pattern(version, file_type='gxt'):
+    """返回对应版本键名的编译正则，无限制的版本返回 None"""
     if version == 'VC' or version == 'III':
-        return re.fullmatch(r'[0-9a-zA-Z_]{1,7}', key) is not None
+        return re.compile(r'[0-9a-zA-Z_]{1,7}')
     elif version == 'SA':
-        if key.lower().startswith('0x'):
-            return re.fullmatch(r'0[xX][0-9a-fA-F]{1,8}', key) is not None
-        # SA now supports plain text hashing via JAMCRC
-        return bool(key and re.fullmatch(r'[A-Za-z0-9_]+', key)) or re.fullmatch(r'[0-9a-fA-F]{1,8}', key) is not None
+        # SA 支持明文键名（JAMCRC 哈希），0x 开头时必须是 1-8 位十六进制
+        return re.compile(r'0[xX][0-9a-fA-F]{1,8}|(?!0[xX])[A-Za-z0-9_]+')
     elif version == 'IV' or version == 'V' or version == 'WHM':
-        if key.lower().startswith('0x'):
-            return re.fullmatch(r'0[xX][0-9a-fA-F]{8}', key) is not None
-        else:
-            return bool(key and re.fullmatch(r'[A-Za-z0-9_]+', key))
-    return True
+        return re.compile(r'0[xX][0-9a-fA-F]{8}|(?!0[xX])[A-Za-z0-9_]+')
+    return None
+
+
+def _validate_key_static(key, version, file_type='gxt'):
+    pattern = _key_pattern(version, file_type)
+    return pattern is None or pattern.fullmatch(key) is not None
 
 
 def _validate_key_for_import_optimized(key, version):
@@ -190,7 +457,7 @@ class FontTextureGenerator:
         char_height_map = {"III": 80, "VC": 64, "SA": 80, "IV": 66}
         char_height = char_height_map.get(settings['version'], 64)
 
-        html_content = f"""
+        header = f"""
         <!DOCTYPE html>
         <html lang="zh-CN"><head><meta charset="UTF-8"><title>字体贴图预览</title>
         <style>
@@ -220,23 +487,22 @@ class FontTextureGenerator:
                 <h2>字符列表 (共 {len(settings['characters'])} 个字符)</h2>
                 <div class="char-grid">
         """
-        
-        for char in settings['characters']:
-            char_code = ord(char)
-            html_content += f"""
+        item_template = """
                 <div class="char-item">
-                    <div class="char-display">{char}</div>
-                    <div class="char-code">U+{char_code:04X}</div>
+                    <div class="char-display">%s</div>
+                    <div class="char-code">U+%04X</div>
                 </div>
             """
-        
-        html_content += """
+        # 直接分段写入文件，避免在内存中拼出完整文档
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(header)
+            for char in settings['characters']:
+                f.write(item_template % (html.escape(char), ord(char)))
+            f.write("""
                 </div>
             </div>
         </div></body></html>
-        """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        """)
 
 
 class ImageViewer(QDialog):
@@ -267,6 +533,13 @@ class ImageViewer(QDialog):
 
         self.scroll_area.viewport().installEventFilter(self)
 
+        # 缩放过程中使用快速插值，停止操作 150ms 后再以平滑模式重绘
+        self._fast_mode = False
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self._do_smooth_refresh)
+
         self.update_image_scale()
         self.resize(2048, 2048)
 
@@ -291,14 +564,20 @@ class ImageViewer(QDialog):
         new_w = max(1, int(self.original_pixmap.width() * self.scale_factor))
         new_h = max(1, int(self.original_pixmap.height() * self.scale_factor))
 
+        mode = (Qt.TransformationMode.FastTransformation if self._fast_mode
+                else Qt.TransformationMode.SmoothTransformation)
         scaled_pixmap = self.original_pixmap.scaled(
             new_w, new_h,
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
+            mode
         )
         self.image_label.setPixmap(scaled_pixmap)
         self.image_label.resize(scaled_pixmap.size())
 
+    def _do_smooth_refresh(self):
+        self._fast_mode = False
+        self.update_image_scale()
+
     def _perform_zoom_at(self, delta_y, point_under_cursor):
         if delta_y == 0:
             return
@@ -319,6 +598,8 @@ class ImageViewer(QDialog):
         MAX_SCALE = 8.0
         self.scale_factor = max(MIN_SCALE, min(MAX_SCALE, self.scale_factor * factor))
 
+        self._fast_mode = True
+        self._smooth_timer.start()
         self.update_image_scale()
 
         new_pos_on_label = pos_on_label * self.scale_factor
@@ -394,6 +675,9 @@ class ClickableLabel(QLabel):
 
 class FontSelectionWidget(QWidget):
     """封装的字体选择控件"""
+    # 按字体文件内容哈希缓存 font_id，重复选择同一字体时无需再次解析
+    _font_cache: dict[bytes, int] = {}
+
     def __init__(self, title, default_font=QFont("Microsoft YaHei", 42)):
         super().__init__()
         self.font = default_font
@@ -429,7 +713,17 @@ class FontSelectionWidget(QWidget):
     def select_font_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "选择字体文件", "", "字体文件 (*.ttf *.otf)")
         if path:
-            font_id = QFontDatabase.addApplicationFont(path)
+            try:
+                data = Path(path).read_bytes()
+            except OSError as e:
+                QMessageBox.warning(self, "错误", f"无法读取字体文件：\n{e}")
+                return
+            h = hashlib.blake2b(data, digest_size=16).digest()
+            font_id = self._font_cache.get(h)
+            if font_id is None:
+                font_id = QFontDatabase.addApplicationFontFromData(data)
+                if font_id != -1:
+                    self._font_cache[h] = font_id
             if font_id != -1:
                 family = QFontDatabase.applicationFontFamilies(font_id)[0]
                 self.font.setFamily(family)
@@ -484,6 +778,10 @@ class FontGeneratorDialog(QDialog):
         self.setMinimumSize(640, 700)
         self.gxt_editor = parent
         self.generator = FontTextureGenerator()
+        # 字符以集合形式保存，排序后的字符串按需生成；另记下传入时含重复的字符总数
+        self._char_set = set()
+        self._chars_str = ""
+        self._char_total = 0
         self.characters = initial_chars
 
         layout = QVBoxLayout(self)
@@ -649,6 +947,24 @@ class FontGeneratorDialog(QDialog):
             label.pixmap_cache = None
             label.setText("生成失败")
 
+    @property
+    def characters(self):
+        if self._chars_str is None:
+            self._chars_str = "".join(sorted(self._char_set))
+        return self._chars_str
+
+    @characters.setter
+    def characters(self, value):
+        self._char_set = set(value)
+        self._chars_str = None
+        self._char_total = len(value)
+
+    def _set_sorted_characters(self, chars):
+        """传入已按码位排序且无重复的字符串，直接复用而不再排序"""
+        self._char_set = set(chars)
+        self._chars_str = chars
+        self._char_total = len(chars)
+
     def load_chars_from_parent(self):
         """从父窗口（GXT编辑器）加载字符，使用对应版本的字符收集逻辑"""
         if self.gxt_editor and hasattr(self.gxt_editor, 'collect_and_filter_chars'):
@@ -691,11 +1007,9 @@ class FontGeneratorDialog(QDialog):
                     return
 
             if content is not None:
-                chars = content.replace("\n", "").replace(" ", "")
-                unique_sorted_chars = "".join(sorted(list(set(chars))))
-                self.characters = unique_sorted_chars
+                self.characters = content.replace("\n", "").replace(" ", "")
                 self.update_char_count()
-                QMessageBox.information(self, "导入成功", f"已导入 {len(unique_sorted_chars)} 个字符 (编码: {detected_encoding}, 已排序)")
+                QMessageBox.information(self, "导入成功", f"已导入 {len(self._char_set)} 个字符 (编码: {detected_encoding}, 已排序)")
             else:
                 QMessageBox.critical(self, "导入失败", "无法识别的文件编码。\n请确保文件是常见的文本编码格式 (如 UTF-8, GBK, UTF-16 等)。")
 
@@ -705,15 +1019,13 @@ class FontGeneratorDialog(QDialog):
             if dlg.exec() == QDialog.DialogCode.Accepted:
                 text = dlg.text_edit.toPlainText()
                 if text:
-                    chars_no_whitespace = text.replace("\n", "").replace(" ", "")
-                    unique_sorted_chars = "".join(sorted(list(set(chars_no_whitespace))))
-                    self.characters = unique_sorted_chars
+                    self.characters = text.replace("\n", "").replace(" ", "")
                     self.update_char_count()
-                    QMessageBox.information(self, "成功", f"已设置 {len(unique_sorted_chars)} 个字符 (已按Unicode排序)")
+                    QMessageBox.information(self, "成功", f"已设置 {len(self._char_set)} 个字符 (已按Unicode排序)")
 
     def show_chars_list(self):
             """显示字符列表对话框"""
-            if not self.characters:
+            if not self._char_set:
                 QMessageBox.information(self, "字符列表", "当前没有字符")
                 return
             
@@ -734,9 +1046,7 @@ class FontGeneratorDialog(QDialog):
         
             layout.addWidget(text_edit)
         
-            char_count = len(self.characters)
-            unique_count = len(set(self.characters))
-            info_label = QLabel(f"字符总数: {char_count} | 唯一字符数: {unique_count}")
+            info_label = QLabel(f"字符总数: {self._char_total} | 唯一字符数: {len(self._char_set)}")
             layout.addWidget(info_label)
         
             btn_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
@@ -748,9 +1058,7 @@ class FontGeneratorDialog(QDialog):
 
     def update_char_count(self):
             """更新字符数量显示"""
-            char_count = len(self.characters)
-            unique_count = len(set(self.characters))
-            self.char_count_label.setText(f"字符总数: {char_count} | 唯一字符数: {unique_count}")
+            self.char_count_label.setText(f"字符总数: {self._char_total} | 唯一字符数: {len(self._char_set)}")
 
     def get_settings(self):
             ver_map = {"GTA IV": "IV", "GTA San Andreas": "SA", "GTA Vice City": "VC", "GTA III": "III"}
@@ -769,17 +1077,15 @@ class FontGeneratorDialog(QDialog):
         if not path:
             return
         try:
-            chars = set()
             with open(path, 'rb') as f:
                 data = f.read()
-                for i in range(0, len(data), 2):
-                    row, col = data[i], data[i + 1]
-                    if not (row == 63 and col == 63):
-                        code = i // 2
-                        chars.add(chr(code))
+            arr = np.frombuffer(data, dtype=np.uint8, count=len(data) & ~1).reshape(-1, 2)
+            # 每个码位占两个字节，(63, 63) 即 "??" 表示该码位未使用
+            codes = np.nonzero(~((arr[:, 0] == 63) & (arr[:, 1] == 63)))[0]
+            chars = "".join(map(chr, codes.tolist()))
             if chars:
-                sorted_chars = "".join(sorted(chars))
-                self.characters = sorted_chars
+                # nonzero 返回的下标本身已升序且唯一
+                self._set_sorted_characters(chars)
                 self.update_char_count()
                 QMessageBox.information(self, "导入成功", f"已从 dat文件中 读取 {len(chars)} 个字符。")
             else:
@@ -793,19 +1099,14 @@ class FontGeneratorDialog(QDialog):
             return
         try:
             with open(path, 'rb') as f:
-                count_bytes = f.read(4)
-                if len(count_bytes) < 4:
-                    raise ValueError("文件格式错误")
-                count = int.from_bytes(count_bytes, 'little')
-                chars = []
-                for _ in range(count):
-                    code_bytes = f.read(4)
-                    if len(code_bytes) < 4:
-                        break
-                    code = int.from_bytes(code_bytes, 'little')
-                    chars.append(chr(code))
+                data = f.read()
+            if len(data) < 4:
+                raise ValueError("文件格式错误")
+            count = min(int.from_bytes(data[:4], 'little'), (len(data) - 4) // 4)
+            codes = np.frombuffer(data, dtype='<u4', count=count, offset=4)
+            chars = list(map(chr, codes.tolist()))
             if chars:
-                self.characters = "".join(sorted(set(chars)))
+                self.characters = chars
                 self.update_char_count()
                 QMessageBox.information(self, "导入成功", f"已从 dat文件中 读取 {len(chars)} 个字符。")
             else:
@@ -814,8 +1115,95 @@ class FontGeneratorDialog(QDialog):
             QMessageBox.critical(self, "错误", f"解析文件失败：{str(e)}")
 
 
+class _MapModel(QAbstractTableModel):
+    """码表映射只读模型，按需格式化显示内容"""
+    HEADERS = ["原文字符 (Original)", "加密字符 (Mapped)"]
+
+    def __init__(self, mapping, parent=None):
+        super().__init__(parent)
+        self._items = list(mapping.items())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        c = self._items[index.row()][index.column()]
+        return f"{c} (U+{ord(c):04X})"
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class _WhmEntryModel(QAbstractTableModel):
+    """WHM 条目只读模型，哈希与预览文本在显示时才格式化"""
+    HEADERS = ["哈希 (Hash)", "文本预览 (Value Preview)"]
+    PREVIEW_LIMIT = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = ()
+        self._texts = []
+
+    def set_entries(self, entries, texts):
+        self.beginResetModel()
+        self._entries = entries
+        self._texts = texts
+        self.endResetModel()
+
+    def clear(self):
+        self.set_entries((), [])
+
+    def full_text(self, row):
+        return self._texts[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return f"0x{self._entries[row].hash:08X}"
+            text = self._texts[row]
+            return text if len(text) <= self.PREVIEW_LIMIT else text[:self.PREVIEW_LIMIT] + "..."
+        # UserRole 只返回行号，完整文本通过 full_text() 取得，避免大字符串经 QVariant 复制
+        if role == Qt.ItemDataRole.UserRole and index.column() == 1:
+            return row
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class _WhmFileFilterProxy(QSortFilterProxyModel):
+    """只按文件名过滤，文件夹随子项自动显示"""
+    def filterAcceptsRow(self, source_row, source_parent):
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        if self.sourceModel().hasChildren(index):
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
+
+
 class CodepageConverterDialog(QDialog):
     """码表转换工具对话框"""
+    _HEX_EQ_RE = re.compile(r'([0-9a-fA-F]+)\s*=\s*([0-9a-fA-F]+)')
+    _CHAR_HEX_RE = re.compile(r'\s*(.)\s+([0-9a-fA-F]+)\s*', re.UNICODE)
+    _HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.gxt_editor = parent
@@ -824,6 +1212,8 @@ class CodepageConverterDialog(QDialog):
 
         self.forward_map = {}
         self.reverse_map = {}
+        self.forward_trans = {}
+        self.reverse_trans = {}
         self.current_table_path = None
 
         layout = QVBoxLayout(self)
@@ -897,19 +1287,18 @@ class CodepageConverterDialog(QDialog):
         chinese_dir = base_path / "GXT_Tables（Chinese）"
         original_dir = base_path / "GXT_Tables（original）"
 
-        self.chinese_list_widget.clear()
-        if chinese_dir.is_dir():
-            for txt_file in sorted(chinese_dir.glob("*.txt")):
-                item = QListWidgetItem(txt_file.stem)
-                item.setData(Qt.ItemDataRole.UserRole, str(txt_file))
-                self.chinese_list_widget.addItem(item)
-        
-        self.original_list_widget.clear()
-        if original_dir.is_dir():
-            for txt_file in sorted(original_dir.glob("*.txt")):
-                item = QListWidgetItem(txt_file.stem)
-                item.setData(Qt.ItemDataRole.UserRole, str(txt_file))
-                self.original_list_widget.addItem(item)
+        for list_widget, table_dir in ((self.chinese_list_widget, chinese_dir),
+                                       (self.original_list_widget, original_dir)):
+            list_widget.clear()
+            if not table_dir.is_dir():
+                continue
+            with os.scandir(table_dir) as it:
+                entries = sorted((e for e in it if e.name.lower().endswith('.txt') and e.is_file()),
+                                 key=lambda e: e.name.casefold())
+            for entry in entries:
+                item = QListWidgetItem(os.path.splitext(entry.name)[0])
+                item.setData(Qt.ItemDataRole.UserRole, entry.path)
+                list_widget.addItem(item)
 
         if self.chinese_list_widget.count() == 0 and self.original_list_widget.count() == 0:
             self.status_label.setText("未在程序目录下找到码表文件夹。")
@@ -934,12 +1323,15 @@ class CodepageConverterDialog(QDialog):
         
         try:
             with open(path, 'r', encoding='utf-8-sig') as f:
-                for line in f:
-                    parsed = self._parse_line(line)
-                    if parsed:
-                        source_char, dest_char = parsed
-                        self.forward_map[source_char] = dest_char
-                        self.reverse_map[dest_char] = source_char
+                data = f.read()
+            parse = self._parse_line
+            pairs = [p for p in map(parse, data.splitlines()) if p]
+            self.forward_map = dict(pairs)
+            self.reverse_map = {dest: src for src, dest in pairs}
+
+            # 预先生成 str.translate 所需的码点映射表
+            self.forward_trans = str.maketrans(self.forward_map)
+            self.reverse_trans = str.maketrans(self.reverse_map)
 
             if self.forward_map:
                 self.current_table_path = path
@@ -966,14 +1358,27 @@ class CodepageConverterDialog(QDialog):
         if not line or line.startswith('#') or line.startswith('//'):
             return None
 
+        # 常见的 hex=hex 格式直接拆分解析，无需走正则；
+        # int() 还接受 0x 前缀、下划线和正负号，先确认两边都只有十六进制数字
+        if '=' in line:
+            a, b = line.split('=', 1)
+            a = a.rstrip()
+            b = b.lstrip()
+            hex_digits = self._HEX_DIGITS
+            if a and b and hex_digits.issuperset(a) and hex_digits.issuperset(b):
+                try:
+                    return chr(int(a, 16)), chr(int(b, 16))
+                except (ValueError, OverflowError):
+                    return None
+
         try:
-            match = re.fullmatch(r'([0-9a-fA-F]+)\s*=\s*([0-9a-fA-F]+)', line)
+            match = self._HEX_EQ_RE.fullmatch(line)
             if match:
                 key_code = int(match.group(1), 16)
                 val_code = int(match.group(2), 16)
                 return chr(key_code), chr(val_code)
 
-            match = re.fullmatch(r'\s*(.)\s+([0-9a-fA-F]+)\s*', line, re.UNICODE)
+            match = self._CHAR_HEX_RE.fullmatch(line)
             if match:
                 char = match.group(1)
                 val_code = int(match.group(2), 16)
@@ -994,18 +1399,12 @@ class CodepageConverterDialog(QDialog):
 
         layout = QVBoxLayout(dialog)
         
-        table = QTableWidget()
-        table.setColumnCount(2)
-        table.setHorizontalHeaderLabels(["原文字符 (Original)", "加密字符 (Mapped)"])
-        table.setRowCount(len(self.forward_map))
+        table = QTableView()
+        table.setModel(_MapModel(self.forward_map, table))
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
-        for i, (original_char, mapped_char) in enumerate(self.forward_map.items()):
-            table.setItem(i, 0, QTableWidgetItem(f"{original_char} (U+{ord(original_char):04X})"))
-            table.setItem(i, 1, QTableWidgetItem(f"{mapped_char} (U+{ord(mapped_char):04X})"))
-        
         layout.addWidget(table)
 
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
@@ -1020,7 +1419,6 @@ class CodepageConverterDialog(QDialog):
             QMessageBox.warning(self, "错误", "请先从列表中选择一个码表文件。")
             return
             
-        mapping = self.reverse_map if reverse else self.forward_map
         op_name = "解密 (新字符 -> 原文)" if reverse else "加密 (原文 -> 新字符)"
 
         
@@ -1037,39 +1435,38 @@ class CodepageConverterDialog(QDialog):
 
         unmapped_chars = set()
         gxt_data = self.gxt_editor.data
-        
-        processed_tables = 0
-        for table_name, table_content in gxt_data.items():
-            if progress.wasCanceled():
-                break
-            progress.setValue(processed_tables)
-            progress.setLabelText(f"正在处理表: {table_name}")
-            
-            for key, value in table_content.items():
-                new_value = []
-                for char in value:
-                    if char in mapping:
-                        new_value.append(mapping[char])
-                    else:
-                        new_value.append(char)
-                        check_map = self.forward_map if reverse else self.reverse_map
-                        if char not in check_map:
-                             unmapped_chars.add(char)
-                gxt_data[table_name][key] = "".join(new_value)
-            processed_tables += 1
-        
+        trans = self.reverse_trans if reverse else self.forward_trans
+        mapping_keys = set(self.reverse_map if reverse else self.forward_map)
+        # 既不在当前映射、也不在反向映射中的字符才算未映射
+        known_chars = self.forward_map.keys() | self.reverse_map.keys()
+        collect_unmapped = unmapped_chars.update
+
+        # 转换期间暂停编辑器刷新，结束时统一刷新一次
+        self.gxt_editor.begin_bulk_update()
+        try:
+            processed_tables = 0
+            for table_name, table_content in gxt_data.items():
+                if progress.wasCanceled():
+                    break
+                progress.setValue(processed_tables)
+                progress.setLabelText(f"正在处理表: {table_name}")
+                for key, value in table_content.items():
+                    chars = set(value)
+                    collect_unmapped(chars.difference(known_chars))
+                    # 与码表没有交集的文本无需转换
+                    if not chars.isdisjoint(mapping_keys):
+                        table_content[key] = value.translate(trans)
+                processed_tables += 1
+        finally:
+            self.gxt_editor.end_bulk_update()
+
         progress.setValue(len(self.gxt_editor.data))
         
         if progress.wasCanceled():
-            self.gxt_editor.refresh_keys()
             QMessageBox.information(self, "已取消", "操作已被用户取消。")
             return
 
         self.gxt_editor.set_modified(True)
-        if self.gxt_editor.global_search_button.isChecked():
-            self.gxt_editor.search_key_value()
-        else:
-            self.gxt_editor.refresh_keys()
         
         if unmapped_chars:
             sorted_unmapped = sorted(list(unmapped_chars))
@@ -1103,84 +1500,103 @@ class WhmBatchWorker(QThread):
     """在后台线程执行WHM批量任务的Worker"""
     finished_with_details = Signal(str, object, int)
     progress_updated = Signal(int, int, str)
+    log_line = Signal(str)
 
-    def __init__(self, mode: str, input_path: Path, output_path: Path or None, exporter_instance: CHtmlTextExport):
+    def __init__(self, mode: str, input_path: Path, output_path: Path or None):
         super().__init__()
         self.mode = mode
         self.input_path = input_path
         self.output_path = output_path
-        self.exporter = exporter_instance
-        self.log_queue = Queue()
         self.exported_count = 0
 
-    def _process_single_whm(self, file_path: Path):
-        """处理单个WHM文件并记录日志到队列"""
-        self.log_queue.put(f"处理: {file_path.name}")
-        try:
-            container = self.exporter.ExtractWhmStrings(file_path, set())
-            if container:
-                output_txt_path = file_path.with_suffix(".txt")
-                counter = 1
-                original_stem = output_txt_path.stem
-                while output_txt_path.exists():
-                    output_txt_path = file_path.parent / f"{original_stem}_{counter}.txt"
-                    counter += 1
-                self.exporter.ExportText(output_txt_path, container)
-                self.exported_count += 1
-                self.log_queue.put(f"处理完成: {file_path.name}")
-        except Exception as e:
-            self.log_queue.put(f"处理失败: {file_path.name}: {e}")
+    def _log(self, msg):
+        self.log_line.emit(f"[{datetime.now():%H:%M:%S}] {msg}")
+
+    @staticmethod
+    def _resolve_output_paths(whm_files):
+        """提前为每个WHM文件分配不重名的TXT输出路径，每个目录只扫描一次"""
+        taken_by_dir = {}
+        name_map = {}
+        for file_path in whm_files:
+            parent = file_path.parent
+            taken = taken_by_dir.get(parent)
+            if taken is None:
+                with os.scandir(parent) as it:
+                    taken = {e.name.lower() for e in it}
+                taken_by_dir[parent] = taken
+            stem = file_path.stem
+            name = f"{stem}.txt"
+            counter = 1
+            while name.lower() in taken:
+                name = f"{stem}_{counter}.txt"
+                counter += 1
+            taken.add(name.lower())
+            name_map[file_path] = parent / name
+        return name_map
 
     def run(self):
         output_result_path = None
         try:
             if self.mode == 'export':
-                self.log_queue.put(f"开始导出: {self.input_path}")
-                whm_files = list(self.input_path.rglob("*.whm"))
+                self._log(f"开始导出: {self.input_path}")
+                whm_files = [Path(p) for p in _iter_files(self.input_path, ".whm")]
                 total_files = len(whm_files)
                 if total_files == 0:
-                    self.log_queue.put("未找到 WHM 文件")
+                    self._log("未找到 WHM 文件")
                     return
 
-                with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
-                    futures = [executor.submit(self._process_single_whm, fp) for fp in whm_files]
-                    for i, future in enumerate(futures):
-                        future.result()
-                        self.progress_updated.emit(i + 1, total_files, whm_files[i].name)
-                        while not self.log_queue.empty():
-                            print(self.log_queue.get())
-                self.log_queue.put(f"导出完成: 共处理 {total_files} 个文件")
+                name_map = self._resolve_output_paths(whm_files)
+                # WHM 解析受 GIL 限制，逐个文件分发到多个进程处理，进程数不超过文件数
+                workers = min(os.cpu_count() or 1, total_files)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(_export_whm_logged, str(fp), str(name_map[fp])) for fp in whm_files]
+                    for i, future in enumerate(as_completed(futures), 1):
+                        (name, exported, err), messages = future.result()
+                        self._log(f"处理: {name}")
+                        for line in messages.splitlines():
+                            if line.strip():
+                                self._log(line)
+                        if err is not None:
+                            self._log(f"处理失败: {name}: {err}")
+                        elif exported:
+                            self.exported_count += 1
+                            self._log(f"处理完成: {name}")
+                        self.progress_updated.emit(i, total_files, name)
+                self._log(f"导出完成: 共处理 {total_files} 个文件")
 
             elif self.mode == 'gendb':
-                self.log_queue.put(f"开始生成数据库: {self.input_path}")
-                txt_files = list(self.input_path.rglob("*.txt"))
+                self._log(f"开始生成数据库: {self.input_path}")
+                txt_files = list(_iter_files(self.input_path, ".txt"))
                 total_files = len(txt_files)
                 
                 for i, file_path in enumerate(txt_files):
-                    self.progress_updated.emit(i + 1, total_files, file_path.name)
-                    self.log_queue.put(f"扫描: {file_path.name}")
+                    file_name = os.path.basename(file_path)
+                    self.progress_updated.emit(i + 1, total_files, file_name)
+                    self._log(f"扫描: {file_name}")
                 
-                self.exporter.GenerateDataBase(self.input_path, self.output_path)
+                CHtmlTextExport().GenerateDataBase(self.input_path, self.output_path)
                 output_result_path = self.output_path
-                self.log_queue.put(f"数据库生成完成: 共处理 {total_files} 个文件")
+                self._log(f"数据库生成完成: 共处理 {total_files} 个文件")
 
         except Exception as e:
-            self.log_queue.put(f"错误: 发生异常 {str(e)}")
+            self._log(f"错误: 发生异常 {str(e)}")
         finally:
-            while not self.log_queue.empty():
-                print(self.log_queue.get())
             self.finished_with_details.emit(self.mode, output_result_path, self.exported_count)
 
 
 class WhmBatchToolDialog(QDialog):
     """WHM批量工具的主对话框"""
+    VIEWER_TEXT_LIMIT = 256 * 1024
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.whm_exporter = CHtmlTextExport()
         self.worker_thread = None
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
-        self.recent_paths = []
+        # 以 OrderedDict 作为有序集合保存最近路径，最新的在最前
+        self.recent_paths = OrderedDict()
+        # 三个路径下拉框共用同一个最近路径模型
+        self._recent_model = QStringListModel(self)
 
         self.setWindowTitle("WHM 文本提取工具")
         self.setMinimumSize(900, 750)
@@ -1197,14 +1613,33 @@ class WhmBatchToolDialog(QDialog):
         self.tabs.addTab(self._create_batch_tab(), "批量处理")
         main_layout.addWidget(self.tabs, 1)
 
+        # 日志先进入缓冲区，每 50ms 合并写入一次，避免逐条重排版
+        self._log_buf = deque(maxlen=2000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         self.log_emitter = WhmLogEmitter()
         self.log_emitter.message_written.connect(self._append_log)
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
     def _append_log(self, text):
-        self.log_view.append(text)
+        self._log_buf.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        self.log_view.append("\n".join(self._log_buf))
+        self._log_buf.clear()
         self.log_view.verticalScrollBar().setValue(self.log_view.verticalScrollBar().maximum())
 
+    def _clear_log(self):
+        self._log_buf.clear()
+        self.log_view.clear()
+
     def _on_tab_changed(self, index):
         is_batch_tab = (self.tabs.widget(index) == self.batch_tab_widget)
         self.log_label.setVisible(is_batch_tab)
@@ -1222,7 +1657,12 @@ class WhmBatchToolDialog(QDialog):
         
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("🔍 搜索文件名...")
-        self.search_edit.textChanged.connect(self._filter_tree)
+        # 输入停顿 150ms 后再过滤，合并连续按键
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._filter_tree)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
         
         top_layout.addWidget(btn_load_whm_root)
         top_layout.addWidget(self.search_edit, 1)
@@ -1230,25 +1670,33 @@ class WhmBatchToolDialog(QDialog):
         
         viewer_splitter = QSplitter(Qt.Orientation.Horizontal)
         
-        self.whm_tree = QTreeWidget()
-        self.whm_tree.setHeaderLabels(["文件/文件夹"])
+        self.whm_tree_model = QStandardItemModel(self)
+        self.whm_tree_model.setHorizontalHeaderLabels(["文件/文件夹"])
+        self.whm_tree_proxy = _WhmFileFilterProxy(self)
+        self.whm_tree_proxy.setSourceModel(self.whm_tree_model)
+        self.whm_tree_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.whm_tree_proxy.setRecursiveFilteringEnabled(True)
+
+        self.whm_tree = QTreeView()
+        self.whm_tree.setModel(self.whm_tree_proxy)
         self.whm_tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.whm_tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.whm_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.whm_tree.itemClicked.connect(self.on_whm_tree_item_selected)
+        self.whm_tree.clicked.connect(self.on_whm_tree_item_selected)
         self.whm_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.whm_tree.customContextMenuRequested.connect(self.show_whm_viewer_context_menu)
         viewer_splitter.addWidget(self.whm_tree)
 
         right_splitter = QSplitter(Qt.Orientation.Vertical)
         
-        self.whm_table = QTableWidget()
-        self.whm_table.setColumnCount(2)
-        self.whm_table.setHorizontalHeaderLabels(["哈希 (Hash)", "文本预览 (Value Preview)"])
+        self.whm_table = QTableView()
+        self.whm_model = _WhmEntryModel(self.whm_table)
+        self.whm_table.setModel(self.whm_model)
         self.whm_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         self.whm_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.whm_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.whm_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.whm_table.itemSelectionChanged.connect(self.on_whm_table_selection_changed)
+        self.whm_table.selectionModel().selectionChanged.connect(self.on_whm_table_selection_changed)
         right_splitter.addWidget(self.whm_table)
 
         viewer_container = QWidget()
@@ -1261,6 +1709,7 @@ class WhmBatchToolDialog(QDialog):
         
         self.whm_value_viewer = QTextEdit()
         self.whm_value_viewer.setReadOnly(True)
+        self.whm_value_viewer.setUndoRedoEnabled(False)
         self.whm_value_viewer.setPlaceholderText("在此处查看完整的文本值...")
         viewer_layout.addWidget(self.whm_value_viewer)
 
@@ -1286,6 +1735,8 @@ class WhmBatchToolDialog(QDialog):
         export_layout = QFormLayout(export_group)
         self.export_input_combo = QComboBox()
         self.export_input_combo.setEditable(True)
+        self.export_input_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.export_input_combo.setModel(self._recent_model)
         self.export_input_combo.lineEdit().setPlaceholderText("选择包含 .whm 文件的根文件夹 (例如: pc/html)")
         export_browse_btn = QPushButton("浏览...")
         export_browse_btn.clicked.connect(self.browse_whm_root)
@@ -1306,6 +1757,8 @@ class WhmBatchToolDialog(QDialog):
         gendb_layout = QFormLayout(gendb_group)
         self.gendb_input_combo = QComboBox()
         self.gendb_input_combo.setEditable(True)
+        self.gendb_input_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.gendb_input_combo.setModel(self._recent_model)
         self.gendb_input_combo.lineEdit().setPlaceholderText("选择包含 .txt 文件的根文件夹")
         gendb_browse_input_btn = QPushButton("浏览...")
         gendb_browse_input_btn.clicked.connect(self.browse_txt_root)
@@ -1316,6 +1769,8 @@ class WhmBatchToolDialog(QDialog):
 
         self.gendb_output_combo = QComboBox()
         self.gendb_output_combo.setEditable(True)
+        self.gendb_output_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.gendb_output_combo.setModel(self._recent_model)
         self.gendb_output_combo.lineEdit().setPlaceholderText("选择 whm_table.dat 的保存位置")
         gendb_browse_output_btn = QPushButton("另存为...")
         gendb_browse_output_btn.clicked.connect(self.browse_gendb_output)
@@ -1344,35 +1799,20 @@ class WhmBatchToolDialog(QDialog):
 
         return self.batch_tab_widget
 
-    def _filter_tree(self, text):
-        text = text.lower()
-        iterator = QTreeWidgetItemIterator(self.whm_tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.childCount() == 0:
-                is_visible = text in item.text(0).lower()
-                item.setHidden(not is_visible)
-            iterator += 1
-        
-        for i in range(self.whm_tree.topLevelItemCount()):
-            website_item = self.whm_tree.topLevelItem(i)
-            has_visible_child = False
-            for j in range(website_item.childCount()):
-                if not website_item.child(j).isHidden():
-                    has_visible_child = True
-                    break
-            website_item.setHidden(not has_visible_child)
-            if has_visible_child and text:
-                website_item.setExpanded(True)
-            elif not text:
-                 website_item.setExpanded(False)
+    def _filter_tree(self):
+        text = self.search_edit.text()
+        self.whm_tree_proxy.setFilterFixedString(text)
+        if text:
+            self.whm_tree.expandAll()
+        else:
+            self.whm_tree.collapseAll()
 
     def browse_and_load_whm_tree(self):
         path_str = QFileDialog.getExistingDirectory(self, "选择 WHM 根文件夹 (例如: pc/html)")
         if not path_str: return
 
-        self.whm_tree.clear()
-        self.whm_table.setRowCount(0)
+        self.whm_tree_model.removeRows(0, self.whm_tree_model.rowCount())
+        self.whm_model.clear()
         self.whm_value_viewer.clear()
         self.search_edit.clear()
 
@@ -1392,19 +1832,22 @@ class WhmBatchToolDialog(QDialog):
             else:
                 dirs_to_process = sorted([d for d in root_path.iterdir() if d.is_dir()], key=lambda p: p.name)
 
+            # 先在内存中构建完整的树，再一次性插入模型
+            top_items = []
             for website_dir in dirs_to_process:
-                website_item = QTreeWidgetItem(self.whm_tree, [website_dir.name])
-                website_item.setIcon(0, self.folder_icon)
-                
-                has_whm_files = False
-                for whm_file in sorted(website_dir.glob("*.whm")):
-                    has_whm_files = True
-                    file_item = QTreeWidgetItem(website_item, [whm_file.name])
-                    file_item.setIcon(0, self.file_icon)
-                    file_item.setData(0, Qt.ItemDataRole.UserRole, str(whm_file))
-                
-                if not has_whm_files:
-                    website_item.setHidden(True)
+                whm_files = sorted(website_dir.glob("*.whm"))
+                if not whm_files:
+                    continue
+                website_item = QStandardItem(self.folder_icon, website_dir.name)
+                children = []
+                for whm_file in whm_files:
+                    file_item = QStandardItem(self.file_icon, whm_file.name)
+                    file_item.setData(str(whm_file), Qt.ItemDataRole.UserRole)
+                    children.append(file_item)
+                website_item.appendRows(children)
+                top_items.append(website_item)
+
+            self.whm_tree_model.invisibleRootItem().appendRows(top_items)
 
         except Exception as e:
             QMessageBox.critical(self, "错误", f"扫描文件夹失败: {e}")
@@ -1412,39 +1855,42 @@ class WhmBatchToolDialog(QDialog):
             self.whm_tree.setUpdatesEnabled(True)
             QApplication.restoreOverrideCursor()
 
-        if self.whm_tree.topLevelItemCount() == 0 or all(self.whm_tree.topLevelItem(i).isHidden() for i in range(self.whm_tree.topLevelItemCount())):
+        if self.whm_tree_model.rowCount() == 0:
             QMessageBox.information(self, "提示", "在该文件夹或其直接子目录中未找到 .whm 文件。")
 
-    def on_whm_tree_item_selected(self, item: QTreeWidgetItem, column: int):
-        file_path_str = item.data(0, Qt.ItemDataRole.UserRole)
-        self.whm_table.setRowCount(0)
+    @staticmethod
+    def _decode_whm_entries(container):
+        """整体解码所有条目文本，仅在整体解码失败时逐条处理"""
+        joined = b'\x00'.join(entry.str for entry in container)
+        try:
+            texts = joined.decode('windows-1252').split('\x00')
+            if len(texts) == len(container):
+                return texts
+        except UnicodeDecodeError:
+            pass
+        texts = []
+        for entry in container:
+            try:
+                texts.append(entry.str.decode('windows-1252'))
+            except UnicodeDecodeError:
+                texts.append(f"[解码错误: {entry.str.hex()}]")
+        return texts
+
+    def on_whm_tree_item_selected(self, index: QModelIndex):
+        file_path_str = index.data(Qt.ItemDataRole.UserRole)
+        self.whm_model.clear()
         self.whm_value_viewer.clear()
         if not file_path_str: return
 
         file_path = Path(file_path_str)
         try:
-            container = self.whm_exporter.ExtractWhmStrings(file_path, set())
+            container = _extract_whm_cached(file_path_str, file_path.stat().st_mtime_ns)
             if not container: return
-
-            self.whm_table.setRowCount(len(container))
-            self.whm_table.setUpdatesEnabled(False)
-            for i, entry in enumerate(container):
-                hash_item = QTableWidgetItem(f"0x{entry.hash:08X}")
-                try:
-                    full_text = entry.str.decode('windows-1252')
-                except UnicodeDecodeError:
-                    full_text = f"[解码错误: {entry.str.hex()}]"
-                
-                preview_text = full_text if len(full_text) <= 100 else full_text[:100] + "..."
-                value_item = QTableWidgetItem(preview_text)
-                value_item.setData(Qt.ItemDataRole.UserRole, full_text)
-                self.whm_table.setItem(i, 0, hash_item)
-                self.whm_table.setItem(i, 1, value_item)
+            self.whm_model.set_entries(container, self._decode_whm_entries(container))
         except Exception as e:
             QMessageBox.warning(self, "解析错误", f"无法解析 {file_path.name}: {e}")
         finally:
-            self.whm_table.setUpdatesEnabled(True)
-            if self.whm_table.rowCount() > 0: self.whm_table.selectRow(0)
+            if self.whm_model.rowCount() > 0: self.whm_table.selectRow(0)
 
     def on_whm_table_selection_changed(self):
         selected_rows = self.whm_table.selectionModel().selectedRows()
@@ -1452,16 +1898,17 @@ class WhmBatchToolDialog(QDialog):
             self.whm_value_viewer.clear()
             return
 
-        value_item = self.whm_table.item(selected_rows[0].row(), 1)
-        if value_item:
-            full_text = value_item.data(Qt.ItemDataRole.UserRole)
-            self.whm_value_viewer.setPlainText(full_text if full_text is not None else "")
+        text = self.whm_model.full_text(selected_rows[0].row()) or ""
+        # 超长文本只显示开头部分，完整内容仍保存在模型中
+        if len(text) > self.VIEWER_TEXT_LIMIT:
+            text = text[:self.VIEWER_TEXT_LIMIT] + "\n…（文本过长，已截断显示）"
+        self.whm_value_viewer.document().setPlainText(text)
 
     def show_whm_viewer_context_menu(self, position):
-        selected_items = self.whm_tree.selectedItems()
-        if not selected_items: return
+        selected_indexes = self.whm_tree.selectionModel().selectedRows()
+        if not selected_indexes: return
 
-        file_paths = [Path(item.data(0, Qt.ItemDataRole.UserRole)) for item in selected_items if item.data(0, Qt.ItemDataRole.UserRole)]
+        file_paths = [p for idx in selected_indexes if (p := idx.data(Qt.ItemDataRole.UserRole))]
         if not file_paths: return
 
         menu = QMenu()
@@ -1475,49 +1922,59 @@ class WhmBatchToolDialog(QDialog):
         output_dir_str = QFileDialog.getExistingDirectory(self, "选择导出 TXT 的目标文件夹")
         if not output_dir_str: return
 
-        output_path = Path(output_dir_str)
         exported_count, failed_files = 0, []
+        error_lines = []
 
         progress = QProgressDialog("正在导出 TXT...", "取消", 0, len(file_paths), self)
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.show()
 
-        for i, file_path in enumerate(file_paths):
-            if progress.wasCanceled(): break
-            progress.setValue(i)
-            progress.setLabelText(f"处理中: {file_path.name}")
-            try:
-                container = self.whm_exporter.ExtractWhmStrings(file_path, set())
-                if container:
-                    output_txt_path = output_path / file_path.with_suffix(".txt").name
-                    self.whm_exporter.ExportText(output_txt_path, container)
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            futures = [executor.submit(_export_one, fp, output_dir_str) for fp in file_paths]
+            total = len(futures)
+            # 进度最多约 30 次/秒刷新，避免小文件时界面重绘拖慢导出
+            last_update = time.monotonic()
+            for i, future in enumerate(as_completed(futures), 1):
+                if progress.wasCanceled():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                file_name, exported, err = future.result()
+                if err is not None:
+                    failed_files.append(file_name)
+                    error_lines.append(f"导出失败: {file_name}: {err}")
+                elif exported:
                     exported_count += 1
-            except Exception as e:
-                failed_files.append(file_path.name)
-                print(f"导出失败: {file_path.name}: {e}")
+                now = time.monotonic()
+                if now - last_update > 0.033 or i == total:
+                    progress.setValue(i)
+                    progress.setLabelText(f"已完成: {file_name}")
+                    last_update = now
         progress.close()
+        # 失败信息在结束后一次性写入日志
+        if error_lines:
+            self.log_emitter.write("\n".join(error_lines))
 
         msg = f"成功导出 {exported_count} 个文件到:\n{output_dir_str}"
         if failed_files:
-            msg += f"\n\n有 {len(failed_files)} 个文件导出失败 (详情请查看控制台/日志)。"
+            msg += f"\n\n有 {len(failed_files)} 个文件导出失败 (详情请查看日志)。"
             QMessageBox.warning(self, "导出完成（部分失败）", msg)
         else:
             QMessageBox.information(self, "导出成功", msg)
 
     def _add_to_recent_paths(self, path):
-        if path in self.recent_paths:
-            self.recent_paths.remove(path)
-        self.recent_paths.insert(0, path)
-        if len(self.recent_paths) > 5:
-            self.recent_paths.pop()
-        
-        for combo in [self.export_input_combo, self.gendb_input_combo, self.gendb_output_combo]:
-            combo.blockSignals(True)
-            current_text = combo.lineEdit().text()
-            combo.clear()
-            combo.addItems(self.recent_paths)
-            combo.lineEdit().setText(current_text)
-            combo.blockSignals(False)
+        # 已经位于首位时列表不变，无需刷新共享模型
+        if next(iter(self.recent_paths), None) == path:
+            return
+        self.recent_paths[path] = None
+        self.recent_paths.move_to_end(path, last=False)
+        while len(self.recent_paths) > 5:
+            self.recent_paths.popitem(last=True)
+        
+        combos = [self.export_input_combo, self.gendb_input_combo, self.gendb_output_combo]
+        texts = [combo.lineEdit().text() for combo in combos]
+        self._recent_model.setStringList(list(self.recent_paths))
+        for combo, text in zip(combos, texts):
+            combo.lineEdit().setText(text)
 
     def browse_whm_root(self):
         path = QFileDialog.getExistingDirectory(self, "选择 WHM 根文件夹 (例如: pc/html)")
@@ -1544,8 +2001,8 @@ class WhmBatchToolDialog(QDialog):
         if not input_path_str or not Path(input_path_str).is_dir():
             QMessageBox.warning(self, "错误", "请输入有效的 WHM 根文件夹路径。")
             return
-        self.log_view.clear()
-        self.log_view.append("--- [任务开始] 从 WHM 导出 TXT ---")
+        self._clear_log()
+        self._append_log("--- [任务开始] 从 WHM 导出 TXT ---")
         self._run_batch_job('export', Path(input_path_str), None)
 
     def run_gendb(self):
@@ -1554,8 +2011,8 @@ class WhmBatchToolDialog(QDialog):
         if not input_path_str or not Path(input_path_str).is_dir() or not output_path_str:
             QMessageBox.warning(self, "错误", "请输入有效的 TXT 根文件夹和数据库输出路径。")
             return
-        self.log_view.clear()
-        self.log_view.append("--- [任务开始] 从 TXT 生成数据库 ---")
+        self._clear_log()
+        self._append_log("--- [任务开始] 从 TXT 生成数据库 ---")
         self._run_batch_job('gendb', Path(input_path_str), Path(output_path_str))
 
     def _run_batch_job(self, mode: str, input_path: Path, output_path: Path or None):
@@ -1567,9 +2024,10 @@ class WhmBatchToolDialog(QDialog):
         sys.stdout = self.log_emitter
         sys.stderr = self.log_emitter
 
-        self.worker_thread = WhmBatchWorker(mode, input_path, output_path, self.whm_exporter)
+        self.worker_thread = WhmBatchWorker(mode, input_path, output_path)
         self.worker_thread.finished_with_details.connect(self._on_job_finished)
         self.worker_thread.progress_updated.connect(self._update_progress)
+        self.worker_thread.log_line.connect(self._append_log, Qt.ConnectionType.QueuedConnection)
         self.worker_thread.start()
 
     def _update_progress(self, processed: int, total: int, current_file: str):
@@ -1582,7 +2040,7 @@ class WhmBatchToolDialog(QDialog):
     def _on_job_finished(self, job_mode: str, output_path: Path or None, exported_count: int):
         sys.stdout = self.original_stdout
         sys.stderr = self.original_stderr
-        self.log_view.append("--- [任务完成] ---")
+        self._append_log("--- [任务完成] ---")
         self._set_ui_enabled(True)
         self.worker_thread = None
 
@@ -1647,15 +2105,52 @@ class EditKeyDialog(QDialog):
         self.original_batch_keys = batch_edit_data['keys'] if self.is_batch_edit_mode and batch_edit_data else []
         self.key_value_pairs = []
 
+        self._initial_key = key
+        self._initial_value = value
+        self._initial_batch_text = batch_edit_data['text'] if self.is_batch_edit_mode and batch_edit_data else ""
+
         layout = QVBoxLayout(self)
+        self._layout = layout
+
+        # 单个/批量输入控件按需创建，未进入的模式不构建
+        self.single_mode_widget = None
+        self.batch_edit = None
+        self.add_mode_widget = None
+
+        if not self.is_batch_edit_mode and self.original_key == "":
+            self.add_mode_widget = QWidget()
+            add_mode_layout = QVBoxLayout(self.add_mode_widget)
+            add_mode_layout.setContentsMargins(0,0,0,0)
+            
+            self.batch_toggle = QPushButton("切换到批量添加模式")
+            self.batch_toggle.setCheckable(True)
+            self.batch_toggle.clicked.connect(self.toggle_add_mode)
+            add_mode_layout.addWidget(self.batch_toggle)
+            
+            self.mode_label = QLabel("当前模式: 单个添加")
+            add_mode_layout.addWidget(self.mode_label)
+            layout.addWidget(self.add_mode_widget)
+
+        self.buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel, self)
+        self.buttons.button(QDialogButtonBox.StandardButton.Save).setText("保存")
+        self.buttons.button(QDialogButtonBox.StandardButton.Cancel).setText("取消")
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        layout.addWidget(self.buttons)
+        
+        self._update_ui_for_mode()
 
+    def _ensure_single_widget(self):
+        """首次需要时创建单个编辑控件"""
+        if self.single_mode_widget is not None:
+            return self.single_mode_widget
         self.single_mode_widget = QWidget()
         single_layout = QVBoxLayout(self.single_mode_widget)
         single_layout.setContentsMargins(0,0,0,0)
         
         key_layout = QHBoxLayout()
         key_layout.addWidget(QLabel("键名 (Key):"))
-        self.key_edit = QLineEdit(key)
+        self.key_edit = QLineEdit(self._initial_key)
         self.key_edit.setPlaceholderText("键名 (Key)")
         key_layout.addWidget(self.key_edit)
         single_layout.addLayout(key_layout)
@@ -1663,64 +2158,37 @@ class EditKeyDialog(QDialog):
         single_layout.addWidget(QLabel("值 (Value):"))
         
         self.value_edit = QTextEdit()
-        self.value_edit.setPlainText(value)
+        self.value_edit.setPlainText(self._initial_value)
         
         single_layout.addWidget(self.value_edit, 1)
-        layout.addWidget(self.single_mode_widget)
+        self._layout.insertWidget(0, self.single_mode_widget)
+        return self.single_mode_widget
 
+    def _ensure_batch_widget(self):
+        """首次需要时创建批量编辑控件"""
+        if self.batch_edit is not None:
+            return self.batch_edit
         self.batch_edit = QTextEdit()
-        initial_batch_text = batch_edit_data['text'] if self.is_batch_edit_mode and batch_edit_data else ""
-        self.batch_edit.setPlainText(initial_batch_text)
+        self.batch_edit.setPlainText(self._initial_batch_text)
         
         if self.is_batch_edit_mode:
             self.batch_edit.setPlaceholderText("每行一个键值对，格式为：键=值\n请确保行数与选择的条目数一致")
         else:
             self.batch_edit.setPlaceholderText("每行输入一个键值对，格式为：键=值\n空行将被忽略")
-        layout.addWidget(self.batch_edit)
-        
-        self.add_mode_widget = QWidget()
-        add_mode_layout = QVBoxLayout(self.add_mode_widget)
-        add_mode_layout.setContentsMargins(0,0,0,0)
-        
-        self.batch_toggle = QPushButton("切换到批量添加模式")
-        self.batch_toggle.setCheckable(True)
-        self.batch_toggle.clicked.connect(self.toggle_add_mode)
-        add_mode_layout.addWidget(self.batch_toggle)
-        
-        self.mode_label = QLabel("当前模式: 单个添加")
-        add_mode_layout.addWidget(self.mode_label)
-        layout.addWidget(self.add_mode_widget)
-
-        self.buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel, self)
-        self.buttons.button(QDialogButtonBox.StandardButton.Save).setText("保存")
-        self.buttons.button(QDialogButtonBox.StandardButton.Cancel).setText("取消")
-        self.buttons.accepted.connect(self.accept)
-        self.buttons.rejected.connect(self.reject)
-        layout.addWidget(self.buttons)
-        
-        self._update_ui_for_mode()
+        idx = 1 if self.single_mode_widget is not None else 0
+        self._layout.insertWidget(idx, self.batch_edit)
+        return self.batch_edit
 
     def _update_ui_for_mode(self):
         """根据当前模式更新UI可见性"""
-        if self.is_batch_edit_mode:
-            self.single_mode_widget.hide()
-            self.batch_edit.show()
-            self.add_mode_widget.hide()
-            return
-
-        is_add_operation = (self.original_key == "")
-        if is_add_operation:
-            self.add_mode_widget.show()
-            if self.is_batch_add_mode:
+        if self.is_batch_edit_mode or self.is_batch_add_mode:
+            if self.single_mode_widget is not None:
                 self.single_mode_widget.hide()
-                self.batch_edit.show()
-            else:
-                self.single_mode_widget.show()
-                self.batch_edit.hide()
+            self._ensure_batch_widget().show()
         else:
-            self.add_mode_widget.hide()
-            self.single_mode_widget.show()
-            self.batch_edit.hide()
+            self._ensure_single_widget().show()
+            if self.batch_edit is not None:
+                self.batch_edit.hide()
 
     def toggle_add_mode(self):
         """切换单个/批量添加模式"""
@@ -1746,7 +2214,7 @@ class EditKeyDialog(QDialog):
     def accept(self):
         if self.is_batch_add_mode or self.is_batch_edit_mode:
             content = self.batch_edit.toPlainText().strip()
-            lines = [line.strip() for line in content.split('\n') if line.strip()]
+            lines = [line for line in map(str.strip, content.split('\n')) if line]
 
             if self.is_batch_edit_mode:
                 if len(lines) != len(self.original_batch_keys):
@@ -1761,19 +2229,22 @@ class EditKeyDialog(QDialog):
 
             parsed_pairs = []
             errors = []
+            pattern = _key_pattern(self.version, self.file_type)
+            hex_ok = self.version in _HEX_KEY_VERSIONS
             for i, line in enumerate(lines, 1):
-                if '=' not in line:
+                key, sep, value = line.partition('=')
+                if not sep:
                     errors.append(f"第 {i} 行: 缺少等号'='分隔符")
                     continue
-                key, value = line.split('=', 1)
-                key_str_temp = key.strip(); key, value = ("0x" + key_str_temp[2:].upper() if key_str_temp.lower().startswith("0x") and len(key_str_temp) == 10 and all(c in '0123456789abcdefABCDEF' for c in key_str_temp[2:]) else key_str_temp.upper()), value.strip()
+                key, is_hex = _normalize_key(key.strip())
+                value = value.strip()
                 if not key:
                     errors.append(f"第 {i} 行: 键名不能为空")
                     continue
                 if not value:
                     errors.append(f"第 {i} 行: 值不能为空")
                     continue
-                if not self.validate_key(key):
+                if pattern is not None and not (is_hex and hex_ok) and pattern.fullmatch(key) is None:
                     errors.append(f"第 {i} 行: {self.get_validation_error_message()}")
                     continue
                 parsed_pairs.append((key, value))
@@ -1787,7 +2258,7 @@ class EditKeyDialog(QDialog):
             self.key_value_pairs = parsed_pairs
         
         else:
-            _key_text = self.key_edit.text().strip(); new_key = "0x" + _key_text[2:].upper() if _key_text.lower().startswith("0x") and len(_key_text) == 10 and all(c in '0123456789abcdefABCDEF' for c in _key_text[2:]) else _key_text.upper()
+            new_key, _ = _normalize_key(self.key_edit.text().strip())
             new_value_raw = self.value_edit.toPlainText()
 
             if '\n' in new_value_raw:
@@ -1838,11 +2309,14 @@ class VersionDialog(QDialog):
         if include_whm:
             self.versions.append(("WHM Table (DAT)", "WHM"))
             
+        # 由 QButtonGroup 维护互斥选择
+        self._group = QButtonGroup(self)
+        self._group.setExclusive(True)
         self.inputs = []
-        for text, val in self.versions:
+        for idx, (text, val) in enumerate(self.versions):
             btn = QPushButton(text)
             btn.setCheckable(True)
-            btn.clicked.connect(lambda _, b=btn: self._select(b))
+            self._group.addButton(btn, idx)
             layout.addWidget(btn)
             self.inputs.append((btn, val))
 
@@ -1862,24 +2336,333 @@ class VersionDialog(QDialog):
         self.buttons.rejected.connect(self.reject)
         layout.addWidget(self.buttons)
 
-    def _select(self, clicked_btn):
-        for b, _ in self.inputs:
-            b.setChecked(b is clicked_btn)
-
     def get_value(self):
-        for b, v in self.inputs:
-            if b.isChecked():
-                return v
-        return "V"
+        idx = self._group.checkedId()
+        return self.inputs[idx][1] if idx >= 0 else "V"
+
+
+
+def _build_search_entries(items, original):
+    """构建搜索缓存：(原始序号, 键, 值, 原文, 键, 值, 原文的 casefold 形式)"""
+    entries = []
+    for i, (k, v) in enumerate(items):
+        o = original.get(k, "")
+        entries.append((i, k, v, o, k.casefold(), v.casefold(), o.casefold()))
+    return entries
+
+
+def _build_search_buffer(entries):
+    """返回 (拼接缓冲区, 偏移列表)，各字段以空字符分隔，条目以换行结尾"""
+    parts = []
+    offsets = []
+    pos = 0
+    for e in entries:
+        offsets.append(pos)
+        seg = f"{e[4]}\x00{e[5]}\x00{e[6]}\n"
+        parts.append(seg)
+        pos += len(seg)
+    offsets.append(pos)
+    return "".join(parts), offsets
+
+
+def _scan_search_buffer(entries, buffer, keyword):
+    """整表查找：在拼接缓冲区上用 str.find 跳到下一个命中，命中过多时改为逐条判断"""
+    buf, offsets = buffer
+    limit = max(64, len(entries) >> 6)
+    hits = []
+    find = buf.find
+    pos = find(keyword)
+    while pos != -1:
+        i = bisect_right(offsets, pos) - 1
+        hits.append(entries[i])
+        if len(hits) > limit:
+            hits.extend(e for e in entries[i + 1:] if keyword in e[4] or keyword in e[5] or keyword in e[6])
+            break
+        pos = find(keyword, offsets[i + 1])
+    return hits
+
+
+def _run_search(jobs, keyword, cancelled=None):
+    """执行搜索任务，不访问任何界面对象，可在后台线程运行
+
+    jobs 中每项为 (表名, 条目快照, 原文, 缓存条目, 缓冲区, 上次命中)，
+    返回 [(表名, 缓存条目, 缓冲区, 命中)]；被取消时返回 None。
+    """
+    results = []
+    for table_name, items, original, entries, buffer, prev_hits in jobs:
+        if cancelled is not None and cancelled():
+            return None
+        if entries is None:
+            entries = _build_search_entries(items, original)
+            buffer = None
+        if not keyword:
+            hits = entries
+        elif prev_hits is not None:
+            # 在预先小写的缓存上做子串判断，实测比 re.IGNORECASE 逐行匹配快数倍
+            hits = [e for e in prev_hits if keyword in e[4] or keyword in e[5] or keyword in e[6]]
+        else:
+            if buffer is None:
+                buffer = _build_search_buffer(entries)
+            hits = _scan_search_buffer(entries, buffer, keyword)
+        results.append((table_name, entries, buffer, hits))
+    return results
+
+
+class _SearchSignals(QObject):
+    finished = Signal(object)
+
+
+class _SearchRunnable(QRunnable):
+    """在线程池中执行键值搜索，结果通过信号交回界面线程"""
+    def __init__(self, context, jobs, keyword, cancelled):
+        super().__init__()
+        self.signals = _SearchSignals()
+        self._context = context
+        self._jobs = jobs
+        self._keyword = keyword
+        self._cancelled = cancelled
+
+    def run(self):
+        results = _run_search(self._jobs, self._keyword, self._cancelled)
+        if results is not None:
+            self.signals.finished.emit((self._context, results))
+
+
+class GxtTableModel(QAbstractTableModel):
+    """主表格的只读模型，行数据为扁平元组列表，显示文本在绘制时才生成"""
+    # 行类型：表头、普通条目、对照模式的原文行与译文行
+    ROW_HEADER, ROW_ENTRY, ROW_ORIGINAL, ROW_TRANSLATION = range(4)
+    HEADERS = ["序号", "键名 (Key)", "值 (Value)"]
+    COMPARE_HEADERS = ["序号", "键名 (Key)", "类型", "内容"]
+    # 视图每次向模型追加的行数，超大表只加载可见部分附近的行
+    FETCH_CHUNK = 500
+
+    _HEADER_BG = QColor(45, 45, 50)
+    _KEY_BG = QColor(35, 38, 45)
+    _KEY_FG = QColor(100, 180, 255)
+    _ORIGINAL_BG = QColor(45, 50, 60)
+    _ORIGINAL_FG = QColor(170, 170, 180)
+    _TRANSLATION_BG = QColor(50, 45, 60)
+    _TRANSLATION_FG = QColor(180, 170, 200)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 每行为 (类型, 表名, 原始序号, 键名, 值, 原文, 分组序号)
+        self._rows = []
+        self._loaded = 0
+        self._compare = False
+        self._limit = 60
+        # 键名 -> 首次出现的行号，首次查找时才建立
+        self._key_rows = None
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+
+    def set_rows(self, rows, compare=False, limit=60):
+        self.beginResetModel()
+        self._rows = rows
+        self._key_rows = None
+        self._loaded = self._chunk_end(min(self.FETCH_CHUNK, len(rows)))
+        self._compare = compare
+        self._limit = limit
+        self.endResetModel()
+
+    def _chunk_end(self, end):
+        """对照模式下原文行和译文行必须一起加载"""
+        if 0 < end < len(self._rows) and self._rows[end - 1][0] == self.ROW_ORIGINAL:
+            end += 1
+        return end
+
+    def ensure_loaded(self, row):
+        """确保第 row 行已加载到视图中"""
+        end = self._chunk_end(min(row + 1, len(self._rows)))
+        if end <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+        self._loaded = end
+        self.endInsertRows()
+
+    def load_all(self):
+        """加载全部行，整表选择及其后的批量操作不能漏掉未加载的行"""
+        if self._rows:
+            self.ensure_loaded(len(self._rows) - 1)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not parent.isValid():
+            self.ensure_loaded(self._loaded + self.FETCH_CHUNK - 1)
+
+    def clear(self):
+        self.set_rows([], self._compare, self._limit)
+
+    def row_at(self, row):
+        """返回行元组 (类型, 表名, 原始序号, 键名, 值, 原文, 分组序号)"""
+        return self._rows[row]
+
+    def is_header(self, row):
+        return self._rows[row][0] == self.ROW_HEADER
+
+    def row_kind(self, row):
+        return self._rows[row][0]
+
+    def table_name_at(self, row):
+        return self._rows[row][1]
+
+    def key_at(self, row):
+        return self._rows[row][3]
+
+    def header_row(self, table_name):
+        for row, r in enumerate(self._rows):
+            if r[0] == self.ROW_HEADER and r[1] == table_name:
+                return row
+        return -1
+
+    def key_row(self, key):
+        if self._key_rows is None:
+            key_rows = {}
+            header = self.ROW_HEADER
+            for row, r in enumerate(self._rows):
+                if r[0] != header:
+                    key_rows.setdefault(r[3], row)
+            self._key_rows = key_rows
+        return self._key_rows.get(key, -1)
+
+    def iter_spans(self, first=0, last=None):
+        """生成 first..last 行中需要合并的单元格 (行, 列, 行数, 列数)"""
+        rows = self._rows
+        # 只有全局搜索（首行必为表头）或对照模式才有合并单元格
+        if not self._compare and (not rows or rows[0][0] != self.ROW_HEADER):
+            return
+        col_count = self.columnCount()
+        if last is None:
+            last = self._loaded - 1
+        header, original = self.ROW_HEADER, self.ROW_ORIGINAL
+        for row in range(first, last + 1):
+            kind = rows[row][0]
+            if kind == header:
+                yield row, 0, 1, col_count
+            elif kind == original:
+                yield row, 0, 2, 1
+                yield row, 1, 2, 1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 4 if self._compare else 3
+
+    def _elide(self, text):
+        return text if len(text) <= self._limit else text[:self._limit] + "..."
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        kind, table_name, idx, key, value, original, group = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if kind == self.ROW_HEADER:
+                return f"以下是：{table_name} 的键值对" if col == 0 else None
+            if kind == self.ROW_ENTRY:
+                if col == 0: return str(idx + 1)
+                if col == 1: return key
+                return self._elide(value)
+            if kind == self.ROW_ORIGINAL:
+                if col == 0: return str(idx + 1)
+                if col == 1: return key
+                if col == 2: return "原文"
+                return self._elide(original) if original else ""
+            if col == 2: return "译文"
+            if col == 3: return self._elide(value)
+            return ""
+
+        if role == Qt.ItemDataRole.UserRole:
+            if kind == self.ROW_ENTRY and col == 2:
+                return value
+            if col == 3:
+                if kind == self.ROW_TRANSLATION:
+                    return value
+                if kind == self.ROW_ORIGINAL and original:
+                    return original
+            return None
 
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if kind == self.ROW_HEADER or col == 0 or (self._compare and col == 2):
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if kind == self.ROW_HEADER:
+                return self._HEADER_BG
+            if kind == self.ROW_ENTRY:
+                return None
+            if col == 1 and kind == self.ROW_ORIGINAL:
+                return self._KEY_BG
+            if col == 2:
+                return self._ORIGINAL_BG if kind == self.ROW_ORIGINAL else self._TRANSLATION_BG
+            if col == 3 and group % 2 == 0:
+                return self._ORIGINAL_BG
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if kind == self.ROW_ORIGINAL:
+                if col == 1: return self._KEY_FG
+                if col == 2: return self._ORIGINAL_FG
+                if col == 3 and original and group % 2 == 0: return self._ORIGINAL_FG
+            elif kind == self.ROW_TRANSLATION and col == 2:
+                return self._TRANSLATION_FG
+            return None
+
+        if role == Qt.ItemDataRole.FontRole and kind == self.ROW_HEADER:
+            return self._header_font
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
 
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            headers = self.COMPARE_HEADERS if self._compare else self.HEADERS
+            return headers[section] if section < len(headers) else None
+        return super().headerData(section, orientation, role)
 
-class FixedTableWidget(QTableWidget):
+
+class FixedTableView(QTableView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
 
+    def setModel(self, model):
+        super().setModel(model)
+        if isinstance(model, GxtTableModel):
+            model.modelReset.connect(self._apply_spans)
+            model.rowsInserted.connect(self._apply_inserted_spans)
+
+    def selectAll(self):
+        model = self.model()
+        if isinstance(model, GxtTableModel):
+            model.load_all()
+        super().selectAll()
+
+    def _apply_spans(self):
+        """模型重置后按行类型重新合并单元格"""
+        self.clearSpans()
+        set_span = self.setSpan
+        for row, col, row_span, col_span in self.model().iter_spans():
+            set_span(row, col, row_span, col_span)
+
+    def _apply_inserted_spans(self, parent, first, last):
+        """增量加载的新行同样需要合并单元格"""
+        set_span = self.setSpan
+        for row, col, row_span, col_span in self.model().iter_spans(first, last):
+            set_span(row, col, row_span, col_span)
+
     def mouseReleaseEvent(self, event):
         super().mouseReleaseEvent(event)
         try:
@@ -1888,6 +2671,240 @@ class FixedTableWidget(QTableWidget):
             pass
 
 
+_THEME_COLORS = (
+    QColor(30, 30, 34),    # dark_bg
+    QColor(25, 25, 28),    # darker_bg
+    QColor(220, 220, 220), # text_color
+    QColor(0, 122, 204),   # highlight
+    QColor(45, 45, 50),    # button_bg
+    QColor(60, 60, 65),    # border_color
+)
+
+
+def _build_qss():
+    """生成中性深色主题样式表（导入时只生成一次）"""
+    dark_bg, darker_bg, text_color, highlight, button_bg, border_color = _THEME_COLORS
+    return f"""
+        QWidget {{
+            font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
+            font-size: 10pt;
+        }}
+        QMainWindow {{
+            background-color: {dark_bg.name()};
+        }}
+        QMenuBar {{
+            background-color: {darker_bg.name()};
+            padding: 5px;
+            border-bottom: 1px solid {border_color.name()};
+        }}
+        QMenuBar::item {{
+            background: transparent;
+            padding: 5px 10px;
+            color: {text_color.name()};
+            border-radius: 4px;
+        }}
+        QMenuBar::item:selected {{
+            background-color: {highlight.name()};
+        }}
+        QMenu {{
+            background-color: {darker_bg.name()};
+            border: 1px solid {border_color.name()};
+            padding: 5px;
+        }}
+        QMenu::item {{
+            padding: 5px 30px 5px 20px;
+        }}
+        QMenu::item:selected {{
+            background-color: {highlight.name()};
+        }}
+        QPushButton {{
+            background-color: {button_bg.name()};
+            color: {text_color.name()};
+            border: 1px solid {border_color.name()};
+            border-radius: 4px;
+            padding: 5px 10px;
+            min-height: 28px;
+        }}
+        QPushButton:hover {{
+            background-color: #3a3a40;
+            border-color: #7a7a7a;
+        }}
+        QPushButton:pressed {{
+            background-color: #2a2a2e;
+        }}
+        QPushButton:checked {{
+            background-color: {highlight.name()};
+            border-color: {QColor(highlight).lighter(120).name()};
+        }}
+        QPushButton#globalSearchButton:checked {{
+            background-color: #d32f2f;
+            border-color: #ff5f52;
+            color: white;
+            font-weight: bold;
+        }}
+        QLineEdit, QTextEdit, QListWidget, QTableView, QComboBox {{
+            background-color: {darker_bg.name()};
+            color: {text_color.name()};
+            border: 1px solid {border_color.name()};
+            border-radius: 4px;
+            padding: 5px;
+            selection-background-color: {highlight.name()};
+            selection-color: white;
+        }}
+        QLineEdit:focus, QTextEdit:focus, QListWidget:focus, QTableView:focus, QComboBox:focus {{
+            border: 1px solid {highlight.name()};
+        }}
+        QDockWidget {{
+            background: {dark_bg.name()};
+            border: 1px solid {border_color.name()};
+            titlebar-normal-icon: none;
+        }}
+        QDockWidget::title {{
+            background: {darker_bg.name()};
+            padding: 5px;
+            text-align: center;
+        }}
+        QHeaderView::section {{
+            background-color: {button_bg.name()};
+            color: {text_color.name()};
+            padding: 5px;
+            border: 1px solid {border_color.name()};
+        }}
+        QTableView::item {{
+            padding: 5px;
+        }}
+        QTableCornerButton::section {{
+            background-color: {button_bg.name()};
+            border: 1px solid {border_color.name()};
+        }}
+        QStatusBar {{
+            background-color: {darker_bg.name()};
+            border-top: 1px solid {border_color.name()};
+            color: {text_color.name()};
+        }}
+        QScrollBar:vertical {{
+            border: none;
+            background: {darker_bg.name()};
+            width: 16px;
+            margin: 2px 0 2px 0;
+        }}
+        QScrollBar::handle:vertical {{
+            background: {button_bg.name()};
+            min-height: 25px;
+            border-radius: 6px;
+            border: 1px solid {border_color.name()};
+        }}
+        QScrollBar::handle:vertical:hover {{
+            background: {QColor(button_bg).lighter(130).name()};
+        }}
+        QScrollBar::handle:vertical:pressed {{
+            background: {QColor(button_bg).darker(110).name()};
+        }}
+        QScrollBar:horizontal {{
+            border: none;
+            background: {darker_bg.name()};
+            height: 16px;
+            margin: 0 2px 0 2px;
+        }}
+        QScrollBar::handle:horizontal {{
+            background: {button_bg.name()};
+            min-width: 25px;
+            border-radius: 6px;
+            border: 1px solid {border_color.name()};
+        }}
+        QScrollBar::handle:horizontal:hover {{
+            background: {QColor(button_bg).lighter(130).name()};
+        }}
+        QScrollBar::handle:horizontal:pressed {{
+            background: {QColor(button_bg).darker(110).name()};
+        }}
+        QScrollBar::add-line, QScrollBar::sub-line {{
+            background: none;
+            border: none;
+            height: 0px;
+            width: 0px;
+        }}
+        QGroupBox {{
+            font-weight: bold;
+            border: 1px solid {border_color.name()};
+            border-radius: 5px;
+            margin-top: 10px;
+            padding-top: 10px;
+        }}
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            subcontrol-position: top center;
+            padding: 0 5px;
+        }}
+        QSplitter::handle {{
+            background-color: {border_color.name()};
+        }}
+        QSplitter::handle:horizontal {{
+            width: 2px;
+        }}
+        QSplitter::handle:vertical {{
+            height: 2px;
+        }}
+        QTabWidget::pane {{
+            border: 1px solid {border_color.name()};
+        }}
+        QTabBar::tab {{
+            background: {button_bg.name()};
+            border: 1px solid {border_color.name()};
+            padding: 8px 15px;
+            border-top-left-radius: 4px;
+            border-top-right-radius: 4px;
+            margin-right: 2px;
+        }}
+        QTabBar::tab:selected {{
+            background: {dark_bg.name()};
+            border-bottom-color: {dark_bg.name()};
+        }}
+        QTabBar::tab:!selected:hover {{
+            background: #4a4a50;
+        }}
+        QProgressBar {{
+            border: 1px solid {border_color.name()};
+            border-radius: 4px;
+            text-align: center;
+            color: {text_color.name()};
+            background-color: {darker_bg.name()};
+        }}
+        QProgressBar::chunk {{
+            background-color: {highlight.name()};
+            border-radius: 4px;
+        }}
+    """
+
+
+_NEUTRAL_DARK_QSS = _build_qss()
+
+_APP_ICON = None
+
+
+def _resolve_icon_path():
+    """定位程序图标文件。"""
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        base_dir = Path(sys._MEIPASS)
+    elif getattr(sys, 'frozen', False):
+        base_dir = Path(sys.executable).parent
+    else:
+        base_dir = Path(__file__).parent
+    return base_dir / "app_icon.ico"
+
+
+def _get_app_icon():
+    """返回缓存的程序图标，首次调用时才从磁盘加载。"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        path = _resolve_icon_path()
+        _APP_ICON = QIcon(str(path)) if path.exists() else QIcon()
+    return _APP_ICON
+
+
+_VERSION_FILENAMES = {'IV': 'GTA4.txt', 'VC': 'GTAVC.txt', 'SA': 'GTASA.txt', 'III': 'GTA3.txt', 'V': 'GTAV.txt'}
+
+
 class GXTEditorApp(QMainWindow):
     def __init__(self, file_to_open=None):
         super().__init__()
@@ -1895,16 +2912,9 @@ class GXTEditorApp(QMainWindow):
         self.resize(1240, 760)
         self.setAcceptDrops(True)
         
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-            base_dir = Path(sys._MEIPASS)
-        elif getattr(sys, 'frozen', False):
-            base_dir = Path(sys.executable).parent
-        else:
-            base_dir = Path(__file__).parent
-
-        icon_path = base_dir / "app_icon.ico"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        icon = _get_app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
              
         self.file_to_open = file_to_open
 
@@ -1914,11 +2924,26 @@ class GXTEditorApp(QMainWindow):
         self.file_type = None
         self.current_table = None
         self.value_display_limit = 60
-        self.version_filename_map = {'IV': 'GTA4.txt', 'VC': 'GTAVC.txt', 'SA': 'GTASA.txt', 'III': 'GTA3.txt', 'V': 'GTAV.txt'}
+        self.version_filename_map = _VERSION_FILENAMES
         self.modified = False
+        self._bulk_update_depth = 0
         
         self.compare_mode = False
         self.original_data = {}
+        # 搜索用的小写缓存，按表名保存，数据修改时失效
+        self._lower_cache = {}
+        # 每个表的小写文本拼接缓冲区及各条目起始偏移，供整表扫描使用
+        self._lower_buf = {}
+        # 上一次搜索的关键字与各表命中项，关键字只是追加字符时在命中项中继续筛选
+        self._last_keyword = None
+        self._last_hits = {}
+        # 搜索代数，每次新搜索、刷新或数据修改时递增，用于丢弃过期的后台搜索结果
+        self._search_generation = 0
+        self._search_worker = None
+        # 排好序的表名列表（MAIN 在最前），表的增删改名与加载文件时失效
+        self._sorted_tables = None
+        # 各表排好序的键名列表，供导出复用，与搜索缓存一同失效
+        self._sorted_keys = {}
         
         self.whm_exporter = CHtmlTextExport()
         self.whm_batch_tool_instance = None
@@ -1931,6 +2956,8 @@ class GXTEditorApp(QMainWindow):
         
         self.remember_gen_extra_choice = None
         self.save_prompt_choice = None
+        # 保存提示框首次需要时才创建，之后重复使用
+        self._save_prompt_box = None
         self._load_settings()
 
         self._apply_neutral_dark_theme()
@@ -1944,11 +2971,12 @@ class GXTEditorApp(QMainWindow):
     def _load_settings(self):
         """从 JSON 文件加载设置"""
         try:
-            if os.path.exists(self.settings_path):
-                with open(self.settings_path, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    self.remember_gen_extra_choice = settings.get('记住生成额外文件的选择')
-                    self.save_prompt_choice = settings.get('文件变更时的默认操作')
+            data = self.settings_path.read_bytes()
+            settings = orjson.loads(data) if orjson else json.loads(data)
+            self.remember_gen_extra_choice = settings.get('记住生成额外文件的选择')
+            self.save_prompt_choice = settings.get('文件变更时的默认操作')
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"无法加载设置: {e}")
 
@@ -1959,8 +2987,17 @@ class GXTEditorApp(QMainWindow):
                 '记住生成额外文件的选择': self.remember_gen_extra_choice,
                 '文件变更时的默认操作': self.save_prompt_choice
             }
-            with open(self.settings_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
+            # orjson 只支持 2 空格缩进，保存统一用 json，格式不随是否安装 orjson 变化
+            data = json.dumps(settings, indent=4, ensure_ascii=False).encode('utf-8')
+            # 先写临时文件再替换，避免写入中途崩溃导致设置文件损坏
+            tmp_path = self.settings_path.with_suffix('.json.tmp')
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, self.settings_path)
+            except Exception:
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink()
+                raise
         except Exception as e:
             print(f"无法保存设置: {e}")
             
@@ -1969,12 +3006,7 @@ class GXTEditorApp(QMainWindow):
         app = QApplication.instance()
         palette = QPalette()
         
-        dark_bg = QColor(30, 30, 34)
-        darker_bg = QColor(25, 25, 28)
-        text_color = QColor(220, 220, 220)
-        highlight = QColor(0, 122, 204)
-        button_bg = QColor(45, 45, 50)
-        border_color = QColor(60, 60, 65)
+        dark_bg, darker_bg, text_color, highlight, button_bg, _ = _THEME_COLORS
         
         palette.setColor(QPalette.ColorRole.Window, dark_bg)
         palette.setColor(QPalette.ColorRole.WindowText, text_color)
@@ -1996,197 +3028,7 @@ class GXTEditorApp(QMainWindow):
         app.setPalette(palette)
         app.setStyle("Fusion")
         
-        app.setStyleSheet(f"""
-            QWidget {{
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
-                font-size: 10pt;
-            }}
-            QMainWindow {{
-                background-color: {dark_bg.name()};
-            }}
-            QMenuBar {{
-                background-color: {darker_bg.name()};
-                padding: 5px;
-                border-bottom: 1px solid {border_color.name()};
-            }}
-            QMenuBar::item {{
-                background: transparent;
-                padding: 5px 10px;
-                color: {text_color.name()};
-                border-radius: 4px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {highlight.name()};
-            }}
-            QMenu {{
-                background-color: {darker_bg.name()};
-                border: 1px solid {border_color.name()};
-                padding: 5px;
-            }}
-            QMenu::item {{
-                padding: 5px 30px 5px 20px;
-            }}
-            QMenu::item:selected {{
-                background-color: {highlight.name()};
-            }}
-            QPushButton {{
-                background-color: {button_bg.name()};
-                color: {text_color.name()};
-                border: 1px solid {border_color.name()};
-                border-radius: 4px;
-                padding: 5px 10px;
-                min-height: 28px;
-            }}
-            QPushButton:hover {{
-                background-color: #3a3a40;
-                border-color: #7a7a7a;
-            }}
-            QPushButton:pressed {{
-                background-color: #2a2a2e;
-            }}
-            QPushButton:checked {{
-                background-color: {highlight.name()};
-                border-color: {QColor(highlight).lighter(120).name()};
-            }}
-            QPushButton#globalSearchButton:checked {{
-                background-color: #d32f2f;
-                border-color: #ff5f52;
-                color: white;
-                font-weight: bold;
-            }}
-            QLineEdit, QTextEdit, QListWidget, QTableWidget, QComboBox {{
-                background-color: {darker_bg.name()};
-                color: {text_color.name()};
-                border: 1px solid {border_color.name()};
-                border-radius: 4px;
-                padding: 5px;
-                selection-background-color: {highlight.name()};
-                selection-color: white;
-            }}
-            QLineEdit:focus, QTextEdit:focus, QListWidget:focus, QTableWidget:focus, QComboBox:focus {{
-                border: 1px solid {highlight.name()};
-            }}
-            QDockWidget {{
-                background: {dark_bg.name()};
-                border: 1px solid {border_color.name()};
-                titlebar-normal-icon: none;
-            }}
-            QDockWidget::title {{
-                background: {darker_bg.name()};
-                padding: 5px;
-                text-align: center;
-            }}
-            QHeaderView::section {{
-                background-color: {button_bg.name()};
-                color: {text_color.name()};
-                padding: 5px;
-                border: 1px solid {border_color.name()};
-            }}
-            QTableWidget::item {{
-                padding: 5px;
-            }}
-            QTableCornerButton::section {{
-                background-color: {button_bg.name()};
-                border: 1px solid {border_color.name()};
-            }}
-            QStatusBar {{
-                background-color: {darker_bg.name()};
-                border-top: 1px solid {border_color.name()};
-                color: {text_color.name()};
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: {darker_bg.name()};
-                width: 16px;
-                margin: 2px 0 2px 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {button_bg.name()};
-                min-height: 25px;
-                border-radius: 6px;
-                border: 1px solid {border_color.name()};
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {QColor(button_bg).lighter(130).name()};
-            }}
-            QScrollBar::handle:vertical:pressed {{
-                background: {QColor(button_bg).darker(110).name()};
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background: {darker_bg.name()};
-                height: 16px;
-                margin: 0 2px 0 2px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {button_bg.name()};
-                min-width: 25px;
-                border-radius: 6px;
-                border: 1px solid {border_color.name()};
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: {QColor(button_bg).lighter(130).name()};
-            }}
-            QScrollBar::handle:horizontal:pressed {{
-                background: {QColor(button_bg).darker(110).name()};
-            }}
-            QScrollBar::add-line, QScrollBar::sub-line {{
-                background: none;
-                border: none;
-                height: 0px;
-                width: 0px;
-            }}
-            QGroupBox {{
-                font-weight: bold;
-                border: 1px solid {border_color.name()};
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-            }}
-            QSplitter::handle {{
-                background-color: {border_color.name()};
-            }}
-            QSplitter::handle:horizontal {{
-                width: 2px;
-            }}
-            QSplitter::handle:vertical {{
-                height: 2px;
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {border_color.name()};
-            }}
-            QTabBar::tab {{
-                background: {button_bg.name()};
-                border: 1px solid {border_color.name()};
-                padding: 8px 15px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background: {dark_bg.name()};
-                border-bottom-color: {dark_bg.name()};
-            }}
-            QTabBar::tab:!selected:hover {{
-                background: #4a4a50;
-            }}
-            QProgressBar {{
-                border: 1px solid {border_color.name()};
-                border-radius: 4px;
-                text-align: center;
-                color: {text_color.name()};
-                background-color: {darker_bg.name()};
-            }}
-            QProgressBar::chunk {{
-                background-color: {highlight.name()};
-                border-radius: 4px;
-            }}
-        """)
+        app.setStyleSheet(_NEUTRAL_DARK_QSS)
 
     def _setup_menu(self):
         menubar = QMenuBar(self)
@@ -2239,7 +3081,13 @@ class GXTEditorApp(QMainWindow):
         
         self.table_search = QLineEdit()
         self.table_search.setPlaceholderText("🔍 搜索表名...")
-        self.table_search.textChanged.connect(self.filter_tables)
+        # 输入停顿 150ms 后才过滤，回车立即过滤
+        self._table_filter_timer = QTimer(self)
+        self._table_filter_timer.setSingleShot(True)
+        self._table_filter_timer.setInterval(150)
+        self._table_filter_timer.timeout.connect(self.filter_tables)
+        self.table_search.textChanged.connect(self._table_filter_timer.start)
+        self.table_search.returnPressed.connect(self.filter_tables)
         left_layout.addWidget(self.table_search)
         
         self.table_list = QListWidget()
@@ -2273,7 +3121,12 @@ class GXTEditorApp(QMainWindow):
         search_layout = QHBoxLayout()
         self.key_search = QLineEdit()
         self.key_search.setPlaceholderText("🔍 搜索键或值...")
-        self.key_search.textChanged.connect(self.search_key_value)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._start_async_search)
+        self.key_search.textChanged.connect(self._search_timer.start)
+        self.key_search.returnPressed.connect(self.search_key_value)
         
         self.global_search_button = QPushButton("全局搜索")
         self.global_search_button.setObjectName("globalSearchButton")
@@ -2285,17 +3138,16 @@ class GXTEditorApp(QMainWindow):
         search_layout.addWidget(self.global_search_button)
         c_layout.addLayout(search_layout)
         
-        self.table = FixedTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["序号", "键名 (Key)", "值 (Value)"])
+        self.table_model = GxtTableModel(self)
+        self.table = FixedTableView()
+        self.table.setModel(self.table_model)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.doubleClicked.connect(self.on_table_double_click)
         self.table.verticalHeader().setVisible(False)
         
-        fm = self.table.fontMetrics()
-        six_digit_width = fm.horizontalAdvance("999999") + 20
-        self.table.setColumnWidth(0, six_digit_width)
+        self.table.setColumnWidth(0, self._index_column_width())
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
@@ -2327,6 +3179,14 @@ class GXTEditorApp(QMainWindow):
             self.update_status("本地搜索模式")
         self.search_key_value()
         
+    def _index_column_width(self):
+        """序号列宽度（容纳 6 位数字），首次计算后缓存在类上"""
+        width = getattr(type(self), '_IDX_COL_W', None)
+        if width is None:
+            width = self.table.fontMetrics().horizontalAdvance("999999") + 20
+            type(self)._IDX_COL_W = width
+        return width
+
     def show_context_menu(self, position):
         """显示右键菜单"""
         is_global_search = self.global_search_button.isChecked()
@@ -2339,8 +3199,7 @@ class GXTEditorApp(QMainWindow):
             return
 
         if is_global_search:
-            first_row_index = selected_rows[0].row()
-            is_header_selection = all(self.table.columnSpan(idx.row(), 0) > 1 for idx in selected_rows)
+            is_header_selection = all(self.table_model.is_header(idx.row()) for idx in selected_rows)
             if is_header_selection:
                 return
 
@@ -2426,412 +3285,241 @@ class GXTEditorApp(QMainWindow):
             self.update_status("错误：请拖拽 .gxt, .gxt2, whm_table.dat 或 .txt 文件/文件夹。")
 
     def filter_tables(self):
+        # 直接调用时取消尚未触发的延迟过滤
+        self._table_filter_timer.stop()
         keyword = self.table_search.text().lower()
-        self.table_list.clear()
-
-        other_tables = sorted([name for name in self.data if name != 'MAIN'])
-        all_table_names = []
-        if 'MAIN' in self.data:
-            all_table_names.append('MAIN')
-        all_table_names.extend(other_tables)
-
-        for name in all_table_names:
-            if keyword in name.lower():
-                self.table_list.addItem(name)
+        if self._sorted_tables is None:
+            other_tables = sorted([name for name in self.data if name != 'MAIN'])
+            all_table_names = []
+            if 'MAIN' in self.data:
+                all_table_names.append('MAIN')
+            all_table_names.extend(other_tables)
+            self._sorted_tables = [(name, name.lower()) for name in all_table_names]
+
+        names = [name for name, lower in self._sorted_tables if keyword in lower]
+        # clear 与 addItems 之间不重绘；不屏蔽信号，选中项变化仍需通知 select_table
+        self.table_list.setUpdatesEnabled(False)
+        try:
+            self.table_list.clear()
+            self.table_list.addItems(names)
+        finally:
+            self.table_list.setUpdatesEnabled(True)
         
         self.update_status(f"显示 {self.table_list.count()} 个表")
 
+    def _refresh_table_list(self):
+        """刷新表列表；全局搜索的结果依赖所有表，需同时重新搜索"""
+        self.filter_tables()
+        if self.global_search_button.isChecked():
+            self.search_key_value()
+
     def select_table(self):
         items = self.table_list.selectedItems()
         if not items:
             if not self.global_search_button.isChecked():
-                self.table.setRowCount(0)
+                self.table_model.clear()
                 self.current_table = None
             return
         
         selected_table_name = items[0].text()
 
         if self.global_search_button.isChecked():
-            header_text = f"以下是：{selected_table_name} 的键值对"
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, 0)
-                if item and self.table.columnSpan(row, 0) > 1 and item.text() == header_text:
-                    self.table.scrollToItem(item, QAbstractItemView.ScrollHint.PositionAtTop)
-                    return
+            row = self.table_model.header_row(selected_table_name)
+            if row >= 0:
+                self.table_model.ensure_loaded(row)
+                self.table.scrollTo(self.table_model.index(row, 0), QAbstractItemView.ScrollHint.PositionAtTop)
             return
 
         self.current_table = selected_table_name
-        self.refresh_keys()
-        # 如果搜索框有内容，立即应用搜索
+        # 搜索框有内容时直接按关键字搜索，否则显示整表，只填充一次表格
         if self.key_search.text().strip():
             self.search_key_value()
+        else:
+            self.refresh_keys()
         self.update_status(f"查看表: {self.current_table}，共 {len(self.data.get(self.current_table, {}))} 个键值对")
 
+    def begin_bulk_update(self):
+        """开始批量修改数据，期间的表格刷新请求会被合并"""
+        self._bulk_update_depth += 1
+
+    def end_bulk_update(self):
+        """结束批量修改并统一刷新一次表格"""
+        self._bulk_update_depth -= 1
+        if self._bulk_update_depth == 0:
+            self._invalidate_search_cache()
+            self.refresh_keys()
+
+    def _invalidate_search_cache(self, *table_names):
+        """使指定表（不指定则全部）的搜索缓存失效"""
+        self._search_generation += 1
+        self._last_keyword = None
+        self._last_hits = {}
+        self._sorted_tables = None
+        if not table_names:
+            self._lower_cache.clear()
+            self._lower_buf.clear()
+            self._sorted_keys.clear()
+            return
+        for name in table_names:
+            self._lower_cache.pop(name, None)
+            self._lower_buf.pop(name, None)
+            self._sorted_keys.pop(name, None)
+
     def refresh_keys(self):
-        """优化后的表格刷新方法，支持对照模式"""
+        """刷新表格，支持对照模式"""
+        if self._bulk_update_depth:
+            return
+        self._search_timer.stop()
+        self._search_generation += 1
         if self.global_search_button.isChecked():
             self.search_key_value()
             return
-            
+
+        rows = []
+        if self.current_table and self.current_table in self.data:
+            original = self.original_data.get(self.current_table, {})
+            matches = ((idx, k, v, original.get(k, "")) for idx, (k, v) in enumerate(self.data[self.current_table].items()))
+            self._append_entry_rows(rows, self.current_table, matches)
+        self._set_table_rows(rows)
+
+    def _append_entry_rows(self, rows, table_name, matches):
+        """把 (原始序号, 键, 值, 原文) 展开为模型行，对照模式下每个条目占两行"""
+        if self.compare_mode:
+            for group, (idx, k, v, original_text) in enumerate(matches):
+                rows.append((GxtTableModel.ROW_ORIGINAL, table_name, idx, k, v, original_text, group))
+                rows.append((GxtTableModel.ROW_TRANSLATION, table_name, idx, k, v, original_text, group))
+        else:
+            entry = GxtTableModel.ROW_ENTRY
+            rows.extend((entry, table_name, idx, k, v, original_text, idx) for idx, k, v, original_text in matches)
+
+    def _set_table_rows(self, rows):
+        """一次性替换表格模型数据并按当前模式设置列宽与选择方式"""
+        # 模型重置、合并单元格与列宽调整期间暂停重绘，结束后只刷新一次
         self.table.setUpdatesEnabled(False)
         try:
+            self.table_model.set_rows(rows, self.compare_mode, self.value_display_limit)
+            header = self.table.horizontalHeader()
             if self.compare_mode:
-                self.table.setColumnCount(4)
-                self.table.setHorizontalHeaderLabels(["序号", "键名 (Key)", "类型", "内容"])
+                self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
+                header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+                header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+                header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+                header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+                self.table.setColumnWidth(2, 60)
             else:
-                self.table.setColumnCount(3)
-                self.table.setHorizontalHeaderLabels(["序号", "键名 (Key)", "值 (Value)"])
-            
-            self.table.setRowCount(0)
-            if self.current_table and self.current_table in self.data:
-                items_to_display = list(self.data[self.current_table].items())
-                
-                if self.compare_mode:
-                    self.table.setRowCount(len(items_to_display) * 2)
-                    
-                    for idx, (k, v) in enumerate(items_to_display):
-                        display_value = v if len(v) <= self.value_display_limit else v[:self.value_display_limit] + "..."
-                        
-                        base_row = idx * 2
-                        
-                        idx_item = QTableWidgetItem(str(idx + 1))
-                        idx_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.table.setItem(base_row, 0, idx_item)
-                        
-                        self.table.setItem(base_row + 1, 0, QTableWidgetItem(""))
-                        self.table.setSpan(base_row, 0, 2, 1)
-                        
-                        key_item = QTableWidgetItem(k)
-                        key_item.setFlags(key_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        key_item.setBackground(QColor(35, 38, 45))
-                        key_item.setForeground(QColor(100, 180, 255))
-                        self.table.setItem(base_row, 1, key_item)
-                        
-                        self.table.setItem(base_row + 1, 1, QTableWidgetItem(""))
-                        self.table.setSpan(base_row, 1, 2, 1)
-                        
-                        is_highlight_group = (idx % 2 == 0)
-                        
-                        type_original_item = QTableWidgetItem("原文")
-                        type_original_item.setFlags(type_original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        type_original_item.setBackground(QColor(45, 50, 60))
-                        type_original_item.setForeground(QColor(170, 170, 180))
-                        type_original_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.table.setItem(base_row, 2, type_original_item)
-                        
-                        type_translate_item = QTableWidgetItem("译文")
-                        type_translate_item.setFlags(type_translate_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        type_translate_item.setBackground(QColor(50, 45, 60))
-                        type_translate_item.setForeground(QColor(180, 170, 200))
-                        type_translate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.table.setItem(base_row + 1, 2, type_translate_item)
-                        
-                        original_text = self.original_data.get(self.current_table, {}).get(k, "")
-                        if original_text:
-                            display_original = original_text if len(original_text) <= self.value_display_limit else original_text[:self.value_display_limit] + "..."
-                            
-                            original_item = QTableWidgetItem(display_original)
-                            original_item.setData(Qt.ItemDataRole.UserRole, original_text)
-                            original_item.setFlags(original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            
-                            if is_highlight_group:
-                                original_item.setBackground(QColor(45, 50, 60))
-                                original_item.setForeground(QColor(170, 170, 180))
-                            
-                            self.table.setItem(base_row, 3, original_item)
-                        else:
-                            empty_item = QTableWidgetItem("")
-                            empty_item.setFlags(empty_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            if is_highlight_group:
-                                empty_item.setBackground(QColor(45, 50, 60))
-                            self.table.setItem(base_row, 3, empty_item)
-                        
-                        value_item = QTableWidgetItem(display_value)
-                        value_item.setData(Qt.ItemDataRole.UserRole, v)
-                        
-                        if is_highlight_group:
-                            value_item.setBackground(QColor(45, 50, 60))
-                        
-                        self.table.setItem(base_row + 1, 3, value_item)
-                else:
-                    self.table.setRowCount(len(items_to_display))
-                    
-                    for idx, (k, v) in enumerate(items_to_display):
-                        display_value = v if len(v) <= self.value_display_limit else v[:self.value_display_limit] + "..."
-                        
-                        idx_item = QTableWidgetItem(str(idx + 1))
-                        idx_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.table.setItem(idx, 0, idx_item)
-                        self.table.setItem(idx, 1, QTableWidgetItem(k))
-                        
-                        value_item = QTableWidgetItem(display_value)
-                        value_item.setData(Qt.ItemDataRole.UserRole, v)
-                        self.table.setItem(idx, 2, value_item)
+                self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+                header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+                header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+                header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         finally:
             self.table.setUpdatesEnabled(True)
-            
-            if self.compare_mode:
-                self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
-                self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-                self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-                self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
-                self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-                self.table.setColumnWidth(2, 60)
-            else:
-                self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-                self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-                self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-                self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
 
     def search_key_value(self):
-        keyword = self.key_search.text().lower()
-        self.table.setUpdatesEnabled(False)
-        try:
-            if self.compare_mode:
-                self.table.setColumnCount(4)
-                self.table.setHorizontalHeaderLabels(["序号", "键名 (Key)", "类型", "内容"])
-            else:
-                self.table.setColumnCount(3)
-                self.table.setHorizontalHeaderLabels(["序号", "键名 (Key)", "值 (Value)"])
-            
-            self.table.setRowCount(0)
-            
-            if self.global_search_button.isChecked():
-                grouped_results = defaultdict(list)
-                total_matches = 0
-                for table_name, entries in self.data.items():
-                    for original_idx, (k, v) in enumerate(entries.items()):
-                        original_text = self.original_data.get(table_name, {}).get(k, "")
-                        search_texts = [k.lower(), str(v).lower()]
-                        if original_text:
-                            search_texts.append(original_text.lower())
-                        if any(keyword in st for st in search_texts):
-                            grouped_results[table_name].append((original_idx, k, v, original_text))
-                            total_matches += 1
-                
-                if not grouped_results:
-                    self.update_status("全局搜索结果: 0 个匹配项")
-                    self.table.setUpdatesEnabled(True)
-                    return
-
-                table_names = list(grouped_results.keys())
-                sorted_table_names = []
-                if 'MAIN' in table_names:
-                    sorted_table_names.append('MAIN')
-                    table_names.remove('MAIN')
-                sorted_table_names.extend(sorted(table_names))
+        if self._bulk_update_depth:
+            return
+        self._search_timer.stop()
+        context, jobs = self._prepare_search()
+        self._finish_search(context, _run_search(jobs, context[1]))
 
-                if self.compare_mode:
-                    total_rows = len(grouped_results) + total_matches * 2
-                else:
-                    total_rows = len(grouped_results) + total_matches
-                self.table.setRowCount(total_rows)
-
-                current_row = 0
-                header_font = QFont()
-                header_font.setBold(True)
-                header_bg = QColor(45, 45, 50)
-                col_count = 4 if self.compare_mode else 3
-
-                for table_name in sorted_table_names:
-                    header_item = QTableWidgetItem(f"以下是：{table_name} 的键值对")
-                    header_item.setFont(header_font)
-                    header_item.setBackground(header_bg)
-                    header_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(current_row, 0, header_item)
-                    self.table.setSpan(current_row, 0, 1, col_count)
-                    current_row += 1
-
-                    for group_idx, (original_idx, k, v, original_text) in enumerate(grouped_results[table_name]):
-                        display_value = v if len(v) <= self.value_display_limit else v[:self.value_display_limit] + "..."
-                        
-                        if self.compare_mode:
-                            is_highlight_group = (group_idx % 2 == 0)
-                            
-                            idx_item = QTableWidgetItem(str(original_idx + 1))
-                            idx_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(current_row, 0, idx_item)
-                            
-                            self.table.setItem(current_row + 1, 0, QTableWidgetItem(""))
-                            self.table.setSpan(current_row, 0, 2, 1)
-                            
-                            key_item = QTableWidgetItem(k)
-                            key_item.setFlags(key_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            key_item.setBackground(QColor(35, 38, 45))
-                            key_item.setForeground(QColor(100, 180, 255))
-                            self.table.setItem(current_row, 1, key_item)
-                            
-                            self.table.setItem(current_row + 1, 1, QTableWidgetItem(""))
-                            self.table.setSpan(current_row, 1, 2, 1)
-                            
-                            type_original_item = QTableWidgetItem("原文")
-                            type_original_item.setFlags(type_original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            type_original_item.setBackground(QColor(45, 50, 60))
-                            type_original_item.setForeground(QColor(170, 170, 180))
-                            type_original_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(current_row, 2, type_original_item)
-                            
-                            type_translate_item = QTableWidgetItem("译文")
-                            type_translate_item.setFlags(type_translate_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            type_translate_item.setBackground(QColor(50, 45, 60))
-                            type_translate_item.setForeground(QColor(180, 170, 200))
-                            type_translate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(current_row + 1, 2, type_translate_item)
-                            
-                            if original_text:
-                                display_original = original_text if len(original_text) <= self.value_display_limit else original_text[:self.value_display_limit] + "..."
-                                original_item = QTableWidgetItem(display_original)
-                                original_item.setData(Qt.ItemDataRole.UserRole, original_text)
-                                original_item.setFlags(original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                                
-                                if is_highlight_group:
-                                    original_item.setBackground(QColor(45, 50, 60))
-                                    original_item.setForeground(QColor(170, 170, 180))
-                                
-                                self.table.setItem(current_row, 3, original_item)
-                            else:
-                                empty_item = QTableWidgetItem("")
-                                empty_item.setFlags(empty_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                                if is_highlight_group:
-                                    empty_item.setBackground(QColor(45, 50, 60))
-                                self.table.setItem(current_row, 3, empty_item)
-                            
-                            value_item = QTableWidgetItem(display_value)
-                            value_item.setData(Qt.ItemDataRole.UserRole, v)
-                            
-                            if is_highlight_group:
-                                value_item.setBackground(QColor(45, 50, 60))
-                            
-                            self.table.setItem(current_row + 1, 3, value_item)
-                            
-                            current_row += 2
-                        else:
-                            idx_item = QTableWidgetItem(str(original_idx + 1))
-                            idx_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(current_row, 0, idx_item)
-                            
-                            self.table.setItem(current_row, 1, QTableWidgetItem(k))
-                            
-                            value_item = QTableWidgetItem(display_value)
-                            value_item.setData(Qt.ItemDataRole.UserRole, v)
-                            self.table.setItem(current_row, 2, value_item)
-                            
-                            current_row += 1
+    def _start_async_search(self):
+        """输入停顿后触发：扫描放到线程池执行，结果回到界面线程再填充表格"""
+        if self._bulk_update_depth:
+            return
+        context, jobs = self._prepare_search()
+        generation = context[0]
+        worker = _SearchRunnable(context, jobs, context[1], lambda: self._search_generation != generation)
+        worker.signals.finished.connect(self._on_async_search_finished)
+        self._search_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_async_search_finished(self, payload):
+        context, results = payload
+        # 期间有新的搜索、刷新或数据修改时丢弃过期结果
+        if context[0] != self._search_generation or self._bulk_update_depth:
+            return
+        self._finish_search(context, results)
 
-                self.table.resizeColumnToContents(1)
-                self.update_status(f"全局搜索结果: {total_matches} 个匹配项")
+    def _prepare_search(self):
+        """在界面线程收集搜索所需数据，返回 (上下文, 任务列表)"""
+        self._search_generation += 1
+        keyword = self.key_search.text().casefold()
+        narrow = bool(self._last_keyword) and keyword.startswith(self._last_keyword)
+        is_global = self.global_search_button.isChecked()
+        if is_global:
+            table_names = list(self.data)
+        elif self.current_table and self.current_table in self.data:
+            table_names = [self.current_table]
+        else:
+            table_names = []
+
+        jobs = []
+        for table_name in table_names:
+            entries = self._lower_cache.get(table_name)
+            if entries is None:
+                # 后台线程只读取快照，避免与界面线程的修改冲突
+                items = list(self.data[table_name].items())
+                original = dict(self.original_data.get(table_name, {}))
             else:
-                if self.current_table and self.current_table in self.data:
-                    matching_items = []
-                    for original_idx, (k, v) in enumerate(self.data[self.current_table].items()):
-                        original_text = self.original_data.get(self.current_table, {}).get(k, "")
-                        search_texts = [k.lower(), str(v).lower()]
-                        if original_text:
-                            search_texts.append(original_text.lower())
-                        if any(keyword in st for st in search_texts):
-                            matching_items.append((original_idx, k, v, original_text))
-                    
-                    if self.compare_mode:
-                        self.table.setRowCount(len(matching_items) * 2)
-                        for row_idx, (original_idx, k, v, original_text) in enumerate(matching_items):
-                            display_value = v if len(v) <= self.value_display_limit else v[:self.value_display_limit] + "..."
-                            
-                            base_row = row_idx * 2
-                            
-                            is_highlight_group = (row_idx % 2 == 0)
-                            
-                            idx_item = QTableWidgetItem(str(original_idx + 1))
-                            idx_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(base_row, 0, idx_item)
-                            
-                            self.table.setItem(base_row + 1, 0, QTableWidgetItem(""))
-                            self.table.setSpan(base_row, 0, 2, 1)
-                            
-                            key_item = QTableWidgetItem(k)
-                            key_item.setFlags(key_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            key_item.setBackground(QColor(35, 38, 45))
-                            key_item.setForeground(QColor(100, 180, 255))
-                            self.table.setItem(base_row, 1, key_item)
-                            
-                            self.table.setItem(base_row + 1, 1, QTableWidgetItem(""))
-                            self.table.setSpan(base_row, 1, 2, 1)
-                            
-                            type_original_item = QTableWidgetItem("原文")
-                            type_original_item.setFlags(type_original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            type_original_item.setBackground(QColor(45, 50, 60))
-                            type_original_item.setForeground(QColor(170, 170, 180))
-                            type_original_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(base_row, 2, type_original_item)
-                            
-                            type_translate_item = QTableWidgetItem("译文")
-                            type_translate_item.setFlags(type_translate_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                            type_translate_item.setBackground(QColor(50, 45, 60))
-                            type_translate_item.setForeground(QColor(180, 170, 200))
-                            type_translate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(base_row + 1, 2, type_translate_item)
-                            
-                            if original_text:
-                                display_original = original_text if len(original_text) <= self.value_display_limit else original_text[:self.value_display_limit] + "..."
-                                original_item = QTableWidgetItem(display_original)
-                                original_item.setData(Qt.ItemDataRole.UserRole, original_text)
-                                original_item.setFlags(original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                                
-                                if is_highlight_group:
-                                    original_item.setBackground(QColor(45, 50, 60))
-                                    original_item.setForeground(QColor(170, 170, 180))
-                                
-                                self.table.setItem(base_row, 3, original_item)
-                            else:
-                                empty_item = QTableWidgetItem("")
-                                empty_item.setFlags(empty_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                                if is_highlight_group:
-                                    empty_item.setBackground(QColor(45, 50, 60))
-                                self.table.setItem(base_row, 3, empty_item)
-                            
-                            value_item = QTableWidgetItem(display_value)
-                            value_item.setData(Qt.ItemDataRole.UserRole, v)
-                            
-                            if is_highlight_group:
-                                value_item.setBackground(QColor(45, 50, 60))
-                            
-                            self.table.setItem(base_row + 1, 3, value_item)
-                    else:
-                        self.table.setRowCount(len(matching_items))
-                        for row_idx, (original_idx, k, v, original_text) in enumerate(matching_items):
-                            display_value = v if len(v) <= self.value_display_limit else v[:self.value_display_limit] + "..."
-                            
-                            idx_item = QTableWidgetItem(str(original_idx + 1))
-                            idx_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(row_idx, 0, idx_item)
-                            self.table.setItem(row_idx, 1, QTableWidgetItem(k))
-                            
-                            value_item = QTableWidgetItem(display_value)
-                            value_item.setData(Qt.ItemDataRole.UserRole, v)
-                            self.table.setItem(row_idx, 2, value_item)
-                    
-                    self.update_status(f"在表 '{self.current_table}' 中搜索到: {len(matching_items)} 个匹配项")
-        finally:
-            self.table.setUpdatesEnabled(True)
-            
-            if self.compare_mode:
-                self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
-                self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-                self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-                self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
-                self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-                self.table.setColumnWidth(2, 60)
+                items = original = None
+            prev_hits = self._last_hits.get(table_name) if narrow else None
+            jobs.append((table_name, items, original, entries, self._lower_buf.get(table_name), prev_hits))
+        context = (self._search_generation, keyword, narrow, is_global, self.current_table)
+        return context, jobs
+
+    def _finish_search(self, context, results):
+        """保存缓存与命中结果并填充表格"""
+        _, keyword, narrow, is_global, current_table = context
+        if not narrow:
+            self._last_hits = {}
+        self._last_keyword = keyword
+        grouped_results = {}
+        total_matches = 0
+        for table_name, entries, buffer, hits in results:
+            self._lower_cache[table_name] = entries
+            if buffer is not None:
+                self._lower_buf[table_name] = buffer
+            self._last_hits[table_name] = hits
+            if hits:
+                grouped_results[table_name] = [e[:4] for e in hits]
+                total_matches += len(hits)
+
+        if is_global:
+            if not grouped_results:
+                self._set_table_rows([])
+                self.update_status("全局搜索结果: 0 个匹配项")
+                return
+
+            table_names = list(grouped_results.keys())
+            sorted_table_names = []
+            if 'MAIN' in table_names:
+                sorted_table_names.append('MAIN')
+                table_names.remove('MAIN')
+            sorted_table_names.extend(sorted(table_names))
+
+            rows = []
+            for table_name in sorted_table_names:
+                rows.append((GxtTableModel.ROW_HEADER, table_name, -1, "", "", "", 0))
+                self._append_entry_rows(rows, table_name, grouped_results[table_name])
+            self._set_table_rows(rows)
+
+            self.table.resizeColumnToContents(1)
+            self.update_status(f"全局搜索结果: {total_matches} 个匹配项")
+        else:
+            rows = []
+            if results:
+                matching_items = grouped_results.get(current_table, [])
+                self._append_entry_rows(rows, current_table, matching_items)
+                self._set_table_rows(rows)
+                self.update_status(f"在表 '{current_table}' 中搜索到: {len(matching_items)} 个匹配项")
             else:
-                self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-                self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-                self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-                self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+                self._set_table_rows(rows)
 
     def validate_table_name(self, name):
         """验证表名是否符合当前版本的规则"""
         if self.version == 'V':
             return True
         elif self.version in ('VC', 'SA', 'IV'):
-            return re.match(r'^[0-9a-zA-Z_]{1,7}$', name) is not None
+            return _TBL_NAME_RE.match(name) is not None
         return True
     
     def _validate_key_for_import(self, key, version):
@@ -2866,11 +3554,10 @@ class GXTEditorApp(QMainWindow):
             if name in self.data:
                 QMessageBox.warning(self, "错误", f"表 '{name}' 已存在！")
                 return
-            self.data[name] = {}
+            self.data[sys.intern(name)] = {}
+            self._invalidate_search_cache(name)
             self.table_search.clear()
-            self.filter_tables()
-            if self.global_search_button.isChecked():
-                self.search_key_value()
+            self._refresh_table_list()
             items = self.table_list.findItems(name, Qt.MatchFlag.MatchExactly)
             if items: self.table_list.setCurrentItem(items[0])
             self.update_status(f"已添加新表: {name}")
@@ -2888,11 +3575,10 @@ class GXTEditorApp(QMainWindow):
         if msg_box.exec() == QMessageBox.StandardButton.Yes:
             old = self.current_table
             del self.data[self.current_table]
+            self._invalidate_search_cache(old)
             self.current_table = None
             self.refresh_keys()
-            self.filter_tables()
-            if self.global_search_button.isChecked():
-                self.search_key_value()
+            self._refresh_table_list()
             self.update_status(f"已删除表: {old}")
             self.set_modified(True)
 
@@ -2912,10 +3598,9 @@ class GXTEditorApp(QMainWindow):
                 QMessageBox.warning(self, "错误", f"表 '{new}' 已存在！")
                 return
             self.data[new] = self.data.pop(old)
+            self._invalidate_search_cache(old, new)
             self.current_table = new
-            self.filter_tables()
-            if self.global_search_button.isChecked():
-                self.search_key_value()
+            self._refresh_table_list()
             items = self.table_list.findItems(new, Qt.MatchFlag.MatchExactly)
             if items: self.table_list.setCurrentItem(items[0])
             self.update_status(f"已将表 '{old}' 重命名为 '{new}'")
@@ -2961,36 +3646,18 @@ class GXTEditorApp(QMainWindow):
 
         if count == 1:
             row = selected_rows[0]
+            model = self.table_model
             
-            if self.table.columnSpan(row, 0) > 1:
+            if model.is_header(row):
                 return
 
-            if self.compare_mode:
-                if row % 2 == 0:
-                    QMessageBox.information(self, "提示", "原版文本行不可编辑，请在下方的汉化文本行进行编辑")
-                    return
-                
-                actual_row = row - 1
-            else:
-                actual_row = row
-
-            if is_global_search:
-                table_name = ""
-                for i in range(actual_row, -1, -1):
-                    if self.table.columnSpan(i, 0) > 1:
-                        text = self.table.item(i, 0).text()
-                        table_name = text.replace("以下是：", "").replace(" 的键值对", "")
-                        break
-                if not table_name: return
-
-                key_item = self.table.item(actual_row, 1)
-                if not key_item: return
-                key = key_item.text()
-            else:
-                table_name = self.current_table
-                key_item = self.table.item(actual_row, 1)
-                if not key_item: return
-                key = key_item.text()
+            if self.compare_mode and model.row_kind(row) == GxtTableModel.ROW_ORIGINAL:
+                QMessageBox.information(self, "提示", "原版文本行不可编辑，请在下方的汉化文本行进行编辑")
+                return
+
+            table_name = model.table_name_at(row) if is_global_search else self.current_table
+            if not table_name: return
+            key = model.key_at(row)
                 
             original_value = self.data[table_name].get(key, "")
             original_text = self.original_data.get(table_name, {}).get(key, "")
@@ -3013,6 +3680,7 @@ class GXTEditorApp(QMainWindow):
                     if table_name in self.original_data and key in self.original_data[table_name]:
                         self.original_data[table_name][new_key] = self.original_data[table_name].pop(key)
                 self.data[table_name][new_key] = new_val
+                self._invalidate_search_cache(table_name)
                 
                 self.search_key_value()
                 self.update_status(f"已更新键: {new_key}")
@@ -3022,43 +3690,29 @@ class GXTEditorApp(QMainWindow):
         
             original_entries = []
             processed_rows = set()
+            model = self.table_model
 
             for row in selected_rows:
 
                 if row in processed_rows:
                     continue
 
-                if self.table.columnSpan(row, 0) > 1:
+                kind, row_table, _, key = model.row_at(row)[:4]
+                if kind == GxtTableModel.ROW_HEADER:
                     continue
 
                 if self.compare_mode:
-                    if row % 2 == 0:
+                    if kind == GxtTableModel.ROW_ORIGINAL:
                         continue
-                    actual_row = row - 1
                     processed_rows.add(row)
-                    processed_rows.add(actual_row)
+                    processed_rows.add(row - 1)
                 else:
-                    actual_row = row
                     processed_rows.add(row)
 
-                table_name = None
-                if is_global_search:
-                    for i in range(actual_row, -1, -1):
-                        if self.table.columnSpan(i, 0) > 1:
-                            text = self.table.item(i, 0).text()
-                            table_name = text.replace("以下是：", "").replace(" 的键值对", "")
-                            break
-                else:
-                    table_name = self.current_table
-
+                table_name = row_table if is_global_search else self.current_table
                 if not table_name:
                     continue
 
-                key_item = self.table.item(actual_row, 1)
-                if not key_item:
-                    continue
-                key = key_item.text()
-
                 value = self.data.get(table_name, {}).get(key, "")
 
                 original_entries.append((table_name, key, value))
@@ -3084,50 +3738,47 @@ class GXTEditorApp(QMainWindow):
                     QMessageBox.critical(self, "错误", "批量编辑返回的数据与原始选择数不匹配。")
                     return
 
-                from collections import defaultdict, Counter
-
-                orig_keys_per_table = defaultdict(list)
-                for tbl, k, _ in original_entries:
-                    orig_keys_per_table[tbl].append(k)
-
-                other_keys_per_table = {t: set(self.data.get(t, {}).keys()) - set(orig_keys_per_table[t]) for t in orig_keys_per_table}
-
-                new_keys_counter_per_table = defaultdict(Counter)
-                for (tbl, _, _), (new_k, _) in zip(original_entries, new_pairs):
-                    new_keys_counter_per_table[tbl][new_k] += 1
+                # 一次遍历按表汇总：旧键 -> (新键, 新值) 以及新键出现次数
+                edits_by_table = {}
+                new_key_counts = {}
+                for (tbl, old_k, _), (new_k, new_v) in zip(original_entries, new_pairs):
+                    edits = edits_by_table.get(tbl)
+                    if edits is None:
+                        edits = edits_by_table[tbl] = {}
+                        new_key_counts[tbl] = Counter()
+                    edits[old_k] = (new_k, new_v)
+                    new_key_counts[tbl][new_k] += 1
 
-                duplicate_new_keys = []
-                for t, counter in new_keys_counter_per_table.items():
-                    for k, cnt in counter.items():
-                        if cnt > 1:
-                            duplicate_new_keys.append(f"{t}:{k} (出现 {cnt} 次)")
+                duplicate_new_keys = [f"{t}:{k} (出现 {cnt} 次)"
+                                      for t, counter in new_key_counts.items()
+                                      for k, cnt in counter.items() if cnt > 1]
 
                 if duplicate_new_keys:
                     QMessageBox.critical(self, "重复键", f"在批量编辑中发现重复键名（同一表内）: {', '.join(duplicate_new_keys)}。\n请确保每个表中键名唯一。")
                     return
 
-                new_keys_per_table = defaultdict(set)
-                for (tbl, _, _), (new_k, _) in zip(original_entries, new_pairs):
-                    new_keys_per_table[tbl].add(new_k)
-
+                # 新键已存在于表中且不是本次编辑的条目之一即为冲突
                 conflicts = []
-                for t in new_keys_per_table:
-                    conf = new_keys_per_table[t].intersection(other_keys_per_table.get(t, set()))
-                    if conf:
-                        conflicts.extend([f"{t}:{c}" for c in conf])
+                for t, counter in new_key_counts.items():
+                    table_dict = self.data.get(t, {})
+                    edits = edits_by_table[t]
+                    conflicts.extend(f"{t}:{k}" for k in counter if k in table_dict and k not in edits)
 
                 if conflicts:
                     QMessageBox.critical(self, "键名冲突", f"发现键名冲突: {', '.join(conflicts)}\n这些键已在表中存在且不属于当前编辑的条目。")
                     return
 
-                edits_by_table = defaultdict(dict)
-                for (tbl, old_k, _), (new_k, new_v) in zip(original_entries, new_pairs):
-                    edits_by_table[tbl][old_k] = (new_k, new_v)
-
                 for table_name, edits in edits_by_table.items():
                     if table_name not in self.data: continue
 
                     original_table_dict = self.data[table_name]
+                    if all(new_key == old_key for old_key, (new_key, _) in edits.items()):
+                        # 只改值不改键名时原地更新，无需重建整个表
+                        for old_key, (_, new_value) in edits.items():
+                            original_table_dict[old_key] = new_value
+                        self._invalidate_search_cache(table_name)
+                        continue
+
                     new_table_dict = {}
                     
                     for old_key, old_value in original_table_dict.items():
@@ -3140,6 +3791,7 @@ class GXTEditorApp(QMainWindow):
                             new_table_dict[old_key] = old_value
                     
                     self.data[table_name] = new_table_dict
+                    self._invalidate_search_cache(table_name)
 
                 self.search_key_value()
                 self.update_status(f"已批量更新 {len(new_pairs)} 个键值对")
@@ -3175,6 +3827,7 @@ class GXTEditorApp(QMainWindow):
                         self.original_data[self.current_table][key] = ""
                         added_count += 1
                         
+                    self._invalidate_search_cache(self.current_table)
                     self.refresh_keys()
                     
                     msg = f"成功添加 {added_count} 个键值对"
@@ -3196,6 +3849,7 @@ class GXTEditorApp(QMainWindow):
                     if self.current_table not in self.original_data:
                         self.original_data[self.current_table] = {}
                     self.original_data[self.current_table][new_key] = ""
+                    self._invalidate_search_cache(self.current_table)
                     self.refresh_keys()
                     self.update_status(f"已添加键: {new_key}")
                     self.set_modified(True)
@@ -3217,6 +3871,7 @@ class GXTEditorApp(QMainWindow):
                         self.data[self.current_table][key] = value
                         added_count += 1
                         
+                    self._invalidate_search_cache(self.current_table)
                     self.refresh_keys()
                     
                     msg = f"成功添加 {added_count} 个键值对"
@@ -3235,6 +3890,7 @@ class GXTEditorApp(QMainWindow):
                         QMessageBox.critical(self, "错误", f"键名 '{new_key}' 已存在！")
                         return
                     self.data[self.current_table][new_key] = new_val
+                    self._invalidate_search_cache(self.current_table)
                     self.refresh_keys()
                     self.update_status(f"已添加键: {new_key}")
                     self.set_modified(True)
@@ -3249,45 +3905,29 @@ class GXTEditorApp(QMainWindow):
         
         processed_rows = set()
         keys_to_delete = []
+        model = self.table_model
         
         for row_index in rows:
             
             if row_index in processed_rows:
                 continue
             
-            if self.table.columnSpan(row_index, 0) > 1:
+            kind, row_table, _, key_to_delete = model.row_at(row_index)[:4]
+            if kind == GxtTableModel.ROW_HEADER:
                 continue
             
             if self.compare_mode:
-                if row_index % 2 == 0:
-                    actual_row = row_index
+                # 原文行与译文行属于同一条目，只处理一次
+                if kind == GxtTableModel.ROW_ORIGINAL:
+                    processed_rows.add(row_index + 1)
                 else:
-                    actual_row = row_index - 1
-                
-                processed_rows.add(row_index)
-                processed_rows.add(actual_row + 1)
-            else:
-                actual_row = row_index
-                processed_rows.add(row_index)
-            
-            table_name = None
-            if is_global_search:
-                for i in range(actual_row, -1, -1):
-                    if self.table.columnSpan(i, 0) > 1:
-                        text = self.table.item(i, 0).text()
-                        table_name = text.replace("以下是：", "").replace(" 的键值对", "")
-                        break
-            else:
-                table_name = self.current_table
+                    processed_rows.add(row_index - 1)
+            processed_rows.add(row_index)
             
+            table_name = row_table if is_global_search else self.current_table
             if not table_name:
                 continue
             
-            key_item = self.table.item(actual_row, 1)
-            if not key_item:
-                continue
-            key_to_delete = key_item.text()
-            
             keys_to_delete.append((table_name, key_to_delete))
         
         unique_keys = list(dict.fromkeys(keys_to_delete))
@@ -3299,13 +3939,21 @@ class GXTEditorApp(QMainWindow):
         
         if msg_box.exec() == QMessageBox.StandardButton.Yes:
             deleted_count = 0
+            touched_tables = set()
             
             for table_name, key_to_delete in unique_keys:
-                if table_name in self.data and key_to_delete in self.data[table_name]:
-                    del self.data[table_name][key_to_delete]
-                    if self.compare_mode and table_name in self.original_data and key_to_delete in self.original_data[table_name]:
-                        del self.original_data[table_name][key_to_delete]
+                table = self.data.get(table_name)
+                if table is not None and key_to_delete in table:
+                    del table[key_to_delete]
+                    if self.compare_mode:
+                        originals = self.original_data.get(table_name)
+                        if originals:
+                            originals.pop(key_to_delete, None)
                     deleted_count += 1
+                    touched_tables.add(table_name)
+            # 每个受影响的表只失效一次缓存
+            if touched_tables:
+                self._invalidate_search_cache(*touched_tables)
 
             self.search_key_value()
             self.update_status(f"已删除 {deleted_count} 个键值对")
@@ -3319,22 +3967,14 @@ class GXTEditorApp(QMainWindow):
         if not rows: return
         
         pairs = []
+        model = self.table_model
         for idx in rows:
             row_index = idx.row()
-            if self.table.columnSpan(row_index, 0) > 1: continue
-
-            if is_global_search:
-                table_name = ""
-                for i in range(row_index, -1, -1):
-                    if self.table.columnSpan(i, 0) > 1:
-                        text = self.table.item(i, 0).text()
-                        table_name = text.replace("以下是：", "").replace(" 的键值对", "")
-                        break
-                if not table_name: continue
-                k = self.table.item(row_index, 1).text()
-            else:
-                table_name = self.current_table
-                k = self.table.item(row_index, 1).text()
+            kind, row_table, _, k = model.row_at(row_index)[:4]
+            if kind == GxtTableModel.ROW_HEADER: continue
+
+            table_name = row_table if is_global_search else self.current_table
+            if not table_name: continue
 
             v = self.data[table_name].get(k, "")
             pairs.append(f"{k}={v}")
@@ -3353,6 +3993,7 @@ class GXTEditorApp(QMainWindow):
         self.current_table = None
         self.compare_mode = False
         self.original_data = {}
+        self._invalidate_search_cache()
         
         version_choice = dlg.get_value()
 
@@ -3362,9 +4003,7 @@ class GXTEditorApp(QMainWindow):
             self.current_table = "whm_table"
             self.data[self.current_table] = {}
             self.table_search.clear()
-            self.filter_tables()
-            if self.global_search_button.isChecked():
-                self.search_key_value()
+            self._refresh_table_list()
             if self.table_list.count() > 0: self.table_list.setCurrentRow(0)
             self.update_status("已创建新WHM文件")
             self._update_ui_for_version()
@@ -3376,9 +4015,7 @@ class GXTEditorApp(QMainWindow):
             if self.version == 'III' or self.version == 'V':
                  self.data["MAIN"] = {}
             self.table_search.clear()
-            self.filter_tables()
-            if self.global_search_button.isChecked():
-                self.search_key_value()
+            self._refresh_table_list()
             if self.table_list.count() > 0: self.table_list.setCurrentRow(0)
             self.update_status(f"已创建新GXT文件 (版本: {self.version})")
             self._update_ui_for_version()
@@ -3402,22 +4039,25 @@ class GXTEditorApp(QMainWindow):
                 self.data.clear()
                 self.compare_mode = False
                 self.original_data = {}
+                self._invalidate_search_cache()
 
+                # 明文键在各表和合并数据间大量重复，驻留后共享同一对象
+                intern_keys = version not in _HEX_KEY_VERSIONS
                 if reader.hasTables():
                     for name, offset in reader.parseTables(mm):
-                        name = name.upper()
+                        name = sys.intern(name.upper())
                         mm.seek(offset)
-                        self.data[name] = dict(reader.parseTKeyTDat(mm))
+                        pairs = reader.parseTKeyTDat(mm)
+                        self.data[name] = {sys.intern(k): v for k, v in pairs} if intern_keys else dict(pairs)
                 else:
-                    self.data["MAIN"] = dict(reader.parseTKeyTDat(mm))
+                    pairs = reader.parseTKeyTDat(mm)
+                    self.data["MAIN"] = {sys.intern(k): v for k, v in pairs} if intern_keys else dict(pairs)
 
                 self.version = version
                 self.filepath = path
                 self.file_type = 'gxt'
                 self.table_search.clear()
-                self.filter_tables()
-                if self.global_search_button.isChecked():
-                    self.search_key_value()
+                self._refresh_table_list()
                 if self.table_list.count() > 0: self.table_list.setCurrentRow(0)
                 self.update_status(f"已打开GXT文件: {os.path.basename(path)}, 版本: {version}")
                 
@@ -3437,9 +4077,10 @@ class GXTEditorApp(QMainWindow):
             self.data.clear()
             self.compare_mode = False
             self.original_data = {}
+            self._invalidate_search_cache()
 
-            table_name = Path(path).stem.upper()
-            self.data[table_name] = {f'0x{h:08X}': v for h, v in parsed_data.items()}
+            table_name = sys.intern(Path(path).stem.upper())
+            self.data[table_name] = dict(zip(_hex_keys(parsed_data), parsed_data.values()))
 
             self.version = 'V'
             self.filepath = path
@@ -3460,68 +4101,72 @@ class GXTEditorApp(QMainWindow):
             QMessageBox.critical(self, "错误", f"打开 GXT2 文件失败: {str(e)}")
 
 
+    def _parse_dat_table(self, data, path):
+        """解析 whm_table.dat 的缓冲区，返回 {键: 文本}"""
+        count = struct.unpack_from("<I", data, 0)[0]
+        off = 4
+        
+        entry_dtype = np.dtype([('h', '<u4'), ('o', '<u4')])
+        
+        if off + (entry_dtype.itemsize * count) > len(data):
+             raise ValueError(f"文件 {path} 在条目表处被截断")
+        
+        entries_off = off
+        off += entry_dtype.itemsize * count
+        
+        if off + 4 > len(data):
+             raise ValueError(f"文件 {path} 在数据块大小处被截断")
+        
+        blob_size = struct.unpack_from("<I", data, off)[0]
+        blob_start = off + 4
+        
+        if blob_start + blob_size > len(data):
+            print(f"警告: Blob size {blob_size} 超出文件大小，已自动调整...")
+            blob_size = len(data) - blob_start
+        
+        # 一次性解析全部 (哈希, 偏移) 条目，转成列表后即释放对映射的引用
+        entries = np.frombuffer(data, dtype=entry_dtype, count=count, offset=entries_off)
+        hashes = entries['h'].tolist()
+        offsets = entries['o']
+        
+        with memoryview(data)[blob_start:blob_start + blob_size] as blob:
+            # 用所有 NUL 位置的二分查找得到每个字符串的结束位置，没有 NUL 时到数据块末尾
+            blob_arr = np.frombuffer(blob, dtype=np.uint8)
+            nul_positions = np.append(np.flatnonzero(blob_arr == 0), blob_size)
+            ends = nul_positions[np.searchsorted(nul_positions, np.minimum(offsets, blob_size))].tolist()
+            offsets = offsets.tolist()
+            del entries, blob_arr
+            
+            decode = self.whm_exporter.decode_bytes
+            texts = [decode(bytes(blob[offset:end])) if offset < blob_size else "[BINARY]"
+                     for offset, end in zip(offsets, ends)]
+        return dict(zip(_hex_keys(hashes), texts))
+
     def open_dat(self, path=None):
         """
         打开 whm_table.dat 文件
         """
         try:
-            data = Path(path).read_bytes()
-            if len(data) < 4:
+            if os.path.getsize(path) < 4:
                 raise ValueError(f"文件 {path} 太小")
             
-            count = struct.unpack_from("<I", data, 0)[0]
-            off = 4
-            
-            entries = []
-            entry_size = struct.calcsize("<II")
-            
-            if off + (entry_size * count) > len(data):
-                 raise ValueError(f"文件 {path} 在条目表处被截断")
-            
-            for _ in range(count):
-                h, o = struct.unpack_from("<II", data, off)
-                entries.append((h, o))
-                off += entry_size
-            
-            if off + 4 > len(data):
-                 raise ValueError(f"文件 {path} 在数据块大小处被截断")
-            
-            blob_size = struct.unpack_from("<I", data, off)[0]
-            blob_start = off + 4
-            
-            if blob_start + blob_size > len(data):
-                print(f"警告: Blob size {blob_size} 超出文件大小，已自动调整...")
-                blob_size = len(data) - blob_start
-            
-            blob = data[blob_start:blob_start + blob_size]
+            # 直接在只读内存映射上解析，避免整文件读入再切片的额外拷贝
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                table = self._parse_dat_table(data, path)
             
             self.data.clear()
             self.compare_mode = False
             self.original_data = {}
+            self._invalidate_search_cache()
             
             table_name = "whm_table"
-            self.data[table_name] = {}
-            
-            for h, offset in entries:
-                if offset < blob_size:
-                    j = offset
-                    while j < blob_size and blob[j] != 0:
-                        j += 1
-                    bts = blob[offset:j]
-                    text = self.whm_exporter.decode_bytes(bts) 
-                else:
-                    text = "[BINARY]"
-                
-                key = f'0x{h:08X}'
-                self.data[table_name][key] = text
+            self.data[table_name] = table
                 
             self.version = "IV"
             self.filepath = path
             self.file_type = 'dat'
             self.table_search.clear()
-            self.filter_tables()
-            if self.global_search_button.isChecked():
-                self.search_key_value()
+            self._refresh_table_list()
             if self.table_list.count() > 0: self.table_list.setCurrentRow(0)
             
             self.update_status(f"已打开DAT文件: {os.path.basename(path)}")
@@ -3568,13 +4213,14 @@ class GXTEditorApp(QMainWindow):
             contains_semicolon = False
 
             if version == 'V':
-                for file_path in files:
-                    parsed_dict = gta5_gxt2.parse_txt(file_path)
-                    table_name = Path(file_path).stem.upper()
+                # 各文件读取解析互不依赖，并行解析后再按原顺序在主线程合并
+                with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+                    parsed_results = list(executor.map(gta5_gxt2.parse_txt, files))
+                for file_path, parsed_dict in zip(files, parsed_results):
+                    table_name = sys.intern(Path(file_path).stem.upper())
                     if table_name not in temp_data:
                         temp_data[table_name] = {}
-                    for h, v in parsed_dict.items():
-                        temp_data[table_name][f'0x{h:08X}'] = v
+                    temp_data[table_name].update(zip(_hex_keys(parsed_dict), parsed_dict.values()))
             else:
                 temp_data, all_errors, temp_original_data, contains_semicolon = self._load_standard_txt(files, version)
 
@@ -3617,11 +4263,10 @@ class GXTEditorApp(QMainWindow):
                 QMessageBox.information(self, "成功", f"已成功打开 {len(files)} 个TXT文件\n版本: {version}\n表数量: {len(self.data)}{mode_text}")
             else:
                 self._merge_data_with_optimized_prompt(temp_data, temp_original_data)
+            self._invalidate_search_cache()
 
             self.table_search.clear()
-            self.filter_tables()
-            if self.global_search_button.isChecked():
-                self.search_key_value()
+            self._refresh_table_list()
             if self.table_list.count() > 0:
                 self.table_list.setCurrentRow(0)
             mode_text = "（对照模式）" if self.compare_mode else ""
@@ -3711,17 +4356,14 @@ class GXTEditorApp(QMainWindow):
 
     def _merge_data_with_optimized_prompt(self, temp_data, temp_original_data=None):
         """优化的合并逻辑：先检查所有冲突，再进行一次性询问"""
-        existing_keys = set((table, key) for table, keys in self.data.items() for key in keys)
-        conflicts = []
-        for table, keys in temp_data.items():
-            for key in keys:
-                if (table, key) in existing_keys:
-                    conflicts.append((table, key))
+        # 只对两边都存在的表做字典视图求交集
+        conflicts = {t: self.data[t].keys() & tdata.keys() for t, tdata in temp_data.items() if t in self.data}
+        conflict_count = sum(map(len, conflicts.values()))
 
         should_overwrite = False
-        if conflicts:
+        if conflict_count:
             msg_box = QMessageBox(QMessageBox.Icon.Question, "确认覆盖",
-                                  f"发现 {len(conflicts)} 个重复的键值对。是否要全部覆盖？",
+                                  f"发现 {conflict_count} 个重复的键值对。是否要全部覆盖？",
                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self)
             msg_box.button(QMessageBox.StandardButton.Yes).setText("是")
             msg_box.button(QMessageBox.StandardButton.No).setText("否")
@@ -3732,25 +4374,30 @@ class GXTEditorApp(QMainWindow):
         added_count = 0
         overwritten_count = 0
         for table_name, table_data in temp_data.items():
-            if table_name not in self.data:
-                self.data[table_name] = {}
-                
-            for key, value in table_data.items():
-                if key in self.data[table_name]:
-                    if should_overwrite:
-                        self.data[table_name][key] = value
-                        overwritten_count += 1
-                else:
-                    self.data[table_name][key] = value
-                    added_count += 1
+            target = self.data.get(table_name)
+            if target is None:
+                self.data[sys.intern(table_name)] = dict(table_data)
+                added_count += len(table_data)
+                continue
+            
+            table_conflicts = conflicts[table_name]
+            if should_overwrite or not table_conflicts:
+                target.update(table_data)
+                if should_overwrite:
+                    overwritten_count += len(table_conflicts)
+            else:
+                target.update({k: v for k, v in table_data.items() if k not in table_conflicts})
+            added_count += len(table_data) - len(table_conflicts)
         
         if temp_original_data:
             for table_name, table_data in temp_original_data.items():
-                if table_name not in self.original_data:
-                    self.original_data[table_name] = {}
-                for key, value in table_data.items():
-                    if key not in self.original_data[table_name] or should_overwrite:
-                        self.original_data[table_name][key] = value
+                target = self.original_data.get(table_name)
+                if target is None:
+                    self.original_data[sys.intern(table_name)] = dict(table_data)
+                elif should_overwrite:
+                    target.update(table_data)
+                else:
+                    target.update({k: v for k, v in table_data.items() if k not in target})
         
         if added_count > 0 or overwritten_count > 0:
             self.set_modified(True)
@@ -3821,41 +4468,32 @@ class GXTEditorApp(QMainWindow):
             try:
                 table_content = self.data.get("whm_table", {})
                 
-                text_table: List[WhmTextData] = []
-                text_data = bytearray()
+                # 条目表按 (哈希, 偏移) 交错存放，字符串先收集再整体编码一次
+                entry_words = []
+                texts = []
+                offset = 0
+                encode = _KEY_ENCODERS['IV']
+                local_extend = entry_words.extend
+                add_text = texts.append
 
                 for key, text in table_content.items():
                     try:
-                        if key.lower().startswith('0x'):
-                            hash_val = int(key, 16)
-                        else:
-                            hash_val = gta4_gxt_hash(key)
+                        hash_val = encode(key)
                     except ValueError:
                         print(f"警告：跳过无效的哈希键 '{key}'")
                         continue
                     
-                    try:
-                        encoded_str = text.encode('utf-8')
-                    except UnicodeEncodeError:
-                        encoded_str = text.encode('utf-8', errors='replace')
-                    
-                    offset = len(text_data)
-                    text_data.extend(encoded_str)
-                    text_data.append(0)
-                    
-                    bin_entry = WhmTextData()
-                    bin_entry.hash = hash_val
-                    bin_entry.offset = offset
-                    text_table.append(bin_entry)
-
+                    local_extend((hash_val, offset))
+                    add_text(text)
+                    # 纯 ASCII 文本的 UTF-8 长度就是字符数，无需单独编码
+                    offset += (len(text) if text.isascii() else len(text.encode('utf-8', errors='replace'))) + 1
+
+                texts.append('')
+                text_data = '\x00'.join(texts).encode('utf-8', errors='replace')
+                count = len(entry_words) // 2
+                header = struct.pack(f"<{len(entry_words) + 2}I", count, *entry_words, len(text_data))
                 with open(path, "wb") as out:
-                    out.write(struct.pack("<I", len(text_table)))
-                    
-                    for bin_entry in text_table:
-                        out.write(struct.pack("<II", bin_entry.hash, bin_entry.offset))
-                    
-                    out.write(struct.pack("<I", len(text_data)))
-                    
+                    out.write(header)
                     out.write(text_data)
                     
                 QMessageBox.information(self, "成功", f"whm_table.dat 文件已保存到 {path}")
@@ -3890,37 +4528,37 @@ class GXTEditorApp(QMainWindow):
             
             if self.version == 'V':
                 strings_to_save = {}
+                encode = _KEY_ENCODERS['V']
                 for table_content in self.data.values():
                     for key, value in table_content.items():
                         try:
-                            if key.lower().startswith('0x'):
-                                hash_val = int(key, 16)
-                            else:
-                                hash_val = gta5_gxt2.joaat(key)
-                            strings_to_save[hash_val] = value
+                            strings_to_save[encode(key)] = value
                         except ValueError:
                             print(f"警告：跳过无效的键 '{key}'")
                 gta5_gxt2.save_gxt2(strings_to_save, os.path.basename(path))
 
             elif self.version == 'IV':
                 m_Data = {}
-                all_chars = set()
+                local_hash = _gta4_hash_cached
                 for table_name, entries_dict in self.data.items():
-                    m_Data[table_name] = []
-                    for key_str, translated_text in entries_dict.items():
-                        hash_str = f'0x{gta4_gxt_hash(key_str):08X}' if not key_str.lower().startswith('0x') else key_str
-                        m_Data[table_name].append({'hash_string': hash_str, 'text': translated_text})
-                        if gen_extra: all_chars.update(c for c in translated_text if ord(c) > 255)
+                    m_Data[table_name] = [
+                        {'hash_string': key_str if key_str.startswith(('0x', '0X')) else '0x%08X' % local_hash(key_str),
+                         'text': translated_text}
+                        for key_str, translated_text in entries_dict.items()
+                    ]
                 write_iv(m_Data, Path(os.path.basename(path)))
-                if gen_extra: process_special_chars(all_chars)
+                if gen_extra:
+                    # 先对拼接后的全部文本去重，再筛选宽字符
+                    all_chars = set("".join(v for d in self.data.values() for v in d.values()))
+                    process_special_chars({c for c in all_chars if ord(c) > 255})
             elif self.version == 'VC':
                 g = VCGXT()
-                sorted_items = sorted(self.data.items(), key=cmp_to_key(lambda a, b: -1 if g._table_sort_method(a[0], b[0]) else 1))
-                sorted_data = OrderedDict(sorted_items)
-                g.m_GxtData = {t: {k: g._utf8_to_utf16(v) for k, v in d.items()} for t, d in sorted_data.items()}
+                # MAIN 表优先，其余按名称排序（与 _table_sort_method 一致）
+                sorted_items = sorted(self.data.items(), key=lambda it: (it[0] != "MAIN", it[0]))
+                g.m_GxtData = {t: {k: g._utf8_to_utf16(v) for k, v in d.items()} for t, d in sorted_items}
                 if gen_extra: 
-                    all_chars = {c for table in self.data.values() for value in table.values() for c in value}
-                    g.m_WideCharCollection = {ord(c) for c in all_chars if ord(c) > 0x7F}
+                    all_ords = set(map(ord, set("".join(v for table in self.data.values() for v in table.values()))))
+                    g.m_WideCharCollection = {cp for cp in all_ords if cp > 0x7F}
                     g.GenerateQCJWStuff()
                 else:
                     if hasattr(g, 'm_WideCharCollection'): 
@@ -3928,19 +4566,12 @@ class GXTEditorApp(QMainWindow):
                 g.SaveAsGXT(os.path.basename(path))
             elif self.version == 'SA':
                 g = SAGXT()
-                def table_sort_method(lhs, rhs):
-                    if rhs == "MAIN":
-                        return False
-                    if lhs == "MAIN":
-                        return True
-                    return lhs < rhs
-                
-                sorted_items = sorted(self.data.items(), key=cmp_to_key(lambda a, b: -1 if table_sort_method(a[0], b[0]) else 1))
-                sorted_data = OrderedDict(sorted_items)
-                g.m_GxtData = {t: {(int(k, 16) if (k.lower().startswith('0x') or (len(k)<=8 and all(c in '0123456789abcdefABCDEF' for c in k))) else gta_sa_hash(k)): v for k, v in d.items()} for t, d in sorted_data.items()}
+                sorted_items = sorted(self.data.items(), key=lambda it: (it[0] != "MAIN", it[0]))
+                encode = _KEY_ENCODERS['SA']
+                g.m_GxtData = {t: {encode(k): v for k, v in d.items()} for t, d in sorted_items}
                 if gen_extra: 
-                    all_chars = {c for table in self.data.values() for value in table.values() for c in value}
-                    g.m_WideCharCollection = {c for c in all_chars if ord(c) > 0x7F}
+                    all_chars = set("".join(v for table in self.data.values() for v in table.values()))
+                    g.m_WideCharCollection = {c for c in all_chars if c > '\x7f'}
                     g.generate_qcjw_stuff()
                 else:
                     if hasattr(g, 'm_WideCharCollection'): 
@@ -3950,8 +4581,8 @@ class GXTEditorApp(QMainWindow):
                 g = LCGXT()
                 g.m_GxtData = {k: g.utf8_to_utf16(v) for k, v in self.data.get('MAIN', {}).items()}
                 if gen_extra: 
-                    all_chars = {c for v in self.data.get('MAIN', {}).values() for c in v}
-                    g.m_WideCharCollection = {ord(c) for c in all_chars if ord(c) >= 0x80}
+                    all_ords = set(map(ord, set("".join(self.data.get('MAIN', {}).values()))))
+                    g.m_WideCharCollection = {cp for cp in all_ords if cp >= 0x80}
                     g.generate_qcjw_stuff()
                 else:
                     if hasattr(g, 'm_WideCharCollection'): 
@@ -3964,6 +4595,17 @@ class GXTEditorApp(QMainWindow):
         finally:
             os.chdir(original_dir)
 
+    def _export_table_lines(self, table_name, entries):
+        """生成单个表按键排序的导出行，对比模式下带上原文"""
+        keys = self._sorted_keys.get(table_name)
+        if keys is None or len(keys) != len(entries):
+            keys = self._sorted_keys[table_name] = sorted(entries)
+        originals = self.original_data.get(table_name) if self.compare_mode else None
+        if not originals:
+            return [f"{k}={entries[k]}\n" for k in keys]
+        return [f"{k}={originals[k]};{entries[k]}\n" if originals.get(k) else f"{k}={entries[k]}\n"
+                for k in keys]
+
     def export_txt(self, single=True):
         if not self.data: 
             QMessageBox.warning(self, "警告", "没有数据可导出")
@@ -3976,19 +4618,12 @@ class GXTEditorApp(QMainWindow):
                     default_filename = self.version_filename_map.get(self.version, "merged.txt")
                 filepath, _ = QFileDialog.getSaveFileName(self, "导出为单个TXT文件", default_filename, "文本文件 (*.txt)")
                 if not filepath: return
+                with_header = self.version not in ['III', 'V'] and self.file_type != 'dat'
                 with open(filepath, 'w', encoding='utf-8') as f:
                     for i, (t, d) in enumerate(sorted(self.data.items())):
-                        if i > 0: f.write("\n\n")
-                        if self.version not in ['III', 'V'] and self.file_type != 'dat': f.write(f"[{t}]\n")
-                        for k, v in sorted(d.items()): 
-                            if self.compare_mode and t in self.original_data and k in self.original_data[t]:
-                                original_text = self.original_data[t][k]
-                                if original_text:
-                                    f.write(f"{k}={original_text};{v}\n")
-                                else:
-                                    f.write(f"{k}={v}\n")
-                            else:
-                                f.write(f"{k}={v}\n")
+                        prefix = "\n\n" if i > 0 else ""
+                        header = f"[{t}]\n" if with_header else ""
+                        f.write(prefix + header + "".join(self._export_table_lines(t, d)))
                 QMessageBox.information(self, "导出成功", f"已导出到: {filepath}")
             else:
                 if self.version == 'III' or self.version == 'V' or self.file_type == 'dat':
@@ -4008,9 +4643,8 @@ class GXTEditorApp(QMainWindow):
                     
                     base_name = base_name.strip()
                     
-                    invalid_chars = r'[\\/:*?"<>|]'
-                    if re.search(invalid_chars, base_name):
-                        QMessageBox.warning(self, "名称无效", f"文件夹名称不能包含以下任何字符:\n{invalid_chars}")
+                    if _INVALID_FILENAME_RE.search(base_name):
+                        QMessageBox.warning(self, "名称无效", f"文件夹名称不能包含以下任何字符:\n{_INVALID_FILENAME_RE.pattern}")
                         default_dirname = base_name
                         continue
                     
@@ -4024,21 +4658,45 @@ class GXTEditorApp(QMainWindow):
                     msg_box.button(QMessageBox.StandardButton.Yes).setText("是")
                     msg_box.button(QMessageBox.StandardButton.No).setText("否")
                     if msg_box.exec() != QMessageBox.StandardButton.Yes: return
-                    shutil.rmtree(export_dir)
-                os.makedirs(export_dir)
-                for t, d in sorted(self.data.items()):
-                    with open(os.path.join(export_dir, f"{t}.txt"), 'w', encoding='utf-8') as f:
-                        f.write(f"[{t}]\n")
-                        for k, v in sorted(d.items()): 
-                            if self.compare_mode and t in self.original_data and k in self.original_data[t]:
-                                original_text = self.original_data[t][k]
-                                if original_text:
-                                    f.write(f"{k}={original_text};{v}\n")
-                                else:
-                                    f.write(f"{k}={v}\n")
-                            else:
-                                f.write(f"{k}={v}\n")
-                QMessageBox.information(self, "导出成功", f"已导出 {len(self.data)} 个文件到:\n{export_dir}")
+                os.makedirs(export_dir, exist_ok=True)
+                def write_table(t, d):
+                    # 先写临时文件再原子替换，覆盖已有目录时不必整体删除重建
+                    target = os.path.join(export_dir, f"{t}.txt")
+                    tmp_path = target + ".tmp"
+                    try:
+                        with open(tmp_path, 'w', encoding='utf-8') as f:
+                            f.write(f"[{t}]\n" + "".join(self._export_table_lines(t, d)))
+                        os.replace(tmp_path, target)
+                    except Exception:
+                        with contextlib.suppress(OSError):
+                            os.remove(tmp_path)
+                        raise
+
+                # 各表文件互不依赖，交给线程池并行写出，失败的表汇总后统一提示
+                failed = []
+                with ThreadPoolExecutor(max_workers=min(8, len(self.data))) as executor:
+                    futures = {executor.submit(write_table, t, d): t for t, d in self.data.items()}
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                        except Exception as e:
+                            failed.append(f"{futures[future]}: {e}")
+                # 只删除本工具导出过、但已不对应任何表的旧 txt 文件（首行为同名表头），不动其他文件和子目录
+                expected = {f"{t}.txt".casefold() for t in self.data}
+                with os.scandir(export_dir) as it:
+                    stale = [e for e in it if e.is_file(follow_symlinks=False)
+                             and e.name.casefold().endswith('.txt') and e.name.casefold() not in expected]
+                for entry in stale:
+                    with contextlib.suppress(OSError, UnicodeDecodeError):
+                        with open(entry.path, 'r', encoding='utf-8') as f:
+                            header = f.readline().strip()
+                        if header.casefold() == f"[{entry.name[:-4]}]".casefold():
+                            os.remove(entry.path)
+                if failed:
+                    failed.sort()
+                    QMessageBox.warning(self, "部分导出失败", f"以下 {len(failed)} 个表导出失败:\n" + "\n".join(failed))
+                else:
+                    QMessageBox.information(self, "导出成功", f"已导出 {len(self.data)} 个文件到:\n{export_dir}")
         except Exception as e:
             QMessageBox.critical(self, "错误", f"导出失败: {str(e)}")
 
@@ -4053,129 +4711,120 @@ class GXTEditorApp(QMainWindow):
         hash_tracker = {} 
         has_tables = version not in ['III', 'V', 'WHM']
         contains_semicolon = False
+        # 与版本相关的判断在循环外算好，逐行只读局部变量
+        needs_hash = version in ('IV', 'WHM')
+        default_table = {'WHM': "whm_table", 'III': "MAIN", 'V': "MAIN"}.get(version)
+        hash_fn = _gta4_hash_cached
+        normalize = _normalize_key
+        validate = _validate_key_for_import_optimized
+        append_err = all_errors.append
 
         for file_path in files:
             current_table = None
-            if not has_tables:
-                table_name_map = {'WHM': "whm_table", 'III': "MAIN", 'V': "MAIN"}
-                current_table = table_name_map.get(version)
-                if current_table and current_table not in data:
-                    data[current_table] = {}
-                if current_table and current_table not in original_data:
-                    original_data[current_table] = {}
+            current_dict = current_originals = None
+            if not has_tables and default_table:
+                current_table = default_table
+                current_dict = data.setdefault(current_table, {})
+                current_originals = original_data.setdefault(current_table, {})
             
+            # 整个文件只解码一次，解码成功后再逐行解析，避免解析到一半才发现编码错误
             try:
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    content = f.readlines()
-            except UnicodeDecodeError:
-                try:
-                    with open(file_path, 'r', encoding='gbk') as f:
-                        content = f.readlines()
-                except Exception as e:
-                    all_errors.append((file_path, 0, "", f"文件编码错误，无法读取: {e}"))
-                    continue
+                text = _read_txt_file(file_path)
             except Exception as e:
-                all_errors.append((file_path, 0, "", f"文件读取失败: {e}"))
+                append_err((file_path, 0, "", f"文件读取失败: {e}"))
+                continue
+            if text is None:
+                append_err((file_path, 0, "", "文件编码错误，无法读取: 无法识别文件编码"))
                 continue
 
-            for line_num, line in enumerate(content, 1):
-                line_content = line.strip()
-                if not line_content or line_content.startswith('//') or line_content.startswith('#'):
-                    continue
+            # newline=None 与文本模式 open 一样统一处理 \r\n 和 \r 换行
+            with io.StringIO(text, newline=None) as f:
+                for line_num, line in enumerate(f, 1):
+                    line_content = line.strip()
+                    if not line_content:
+                        continue
+                    # 按首字符分派，注释、原文行、表头都只看一次首字符
+                    first = line_content[0]
+                    if first == '#' or line_content.startswith('//'):
+                        continue
                 
-                if line_content.startswith(';') and '=' in line_content:
-                    vcs_line = line_content[1:]
-                    if '=' in vcs_line:
-                        vcs_key, vcs_value = vcs_line.split('=', 1)
-                        vcs_key = vcs_key.strip().upper()
-                        vcs_value = vcs_value.strip()
+                    if first == ';' and '=' in line_content:
+                        vcs_key, _, vcs_value = line_content.partition('=')
+                        vcs_key = vcs_key[1:].strip().upper()
                         if vcs_key and current_table:
-                            if current_table not in original_data:
-                                original_data[current_table] = {}
-                            original_data[current_table][vcs_key] = vcs_value
+                            current_originals[vcs_key] = vcs_value.strip()
                             contains_semicolon = True
-                    continue
+                        continue
                 
-                if line_content.startswith('[') and line_content.endswith(']'):
-                    if has_tables:
-                        table_name = line_content[1:-1].strip().upper()
-                        if table_name:
-                            current_table = table_name
-                            if current_table not in data:
-                                data[current_table] = {}
-                            if current_table not in original_data:
-                                original_data[current_table] = {}
-                    else:
-                        msg = f"格式错误: 当前版本 ({version}) 不支持表，但文件中发现了表头 '{line_content}'"
-                        all_errors.append((file_path, line_num, line_content, msg))
+                    if first == '[' and line_content[-1] == ']':
+                        if has_tables:
+                            table_name = line_content[1:-1].strip().upper()
+                            if table_name:
+                                current_table = sys.intern(table_name)
+                                current_dict = data.setdefault(current_table, {})
+                                current_originals = original_data.setdefault(current_table, {})
+                        else:
+                            msg = f"格式错误: 当前版本 ({version}) 不支持表，但文件中发现了表头 '{line_content}'"
+                            append_err((file_path, line_num, line_content, msg))
                 
-                elif '=' in line_content:
-                    if has_tables and current_table is None:
-                        msg = "格式错误: 在定义表 ([TableName]) 之前出现了键值对"
-                        all_errors.append((file_path, line_num, line_content, msg))
-                        continue
+                    elif '=' in line_content:
+                        if has_tables and current_table is None:
+                            msg = "格式错误: 在定义表 ([TableName]) 之前出现了键值对"
+                            append_err((file_path, line_num, line_content, msg))
+                            continue
 
-                    key, value = line_content.split('=', 1)
-                    key_str_temp = key.strip(); key = "0x" + key_str_temp[2:].upper() if key_str_temp.lower().startswith("0x") and len(key_str_temp) == 10 and all(c in '0123456789abcdefABCDEF' for c in key_str_temp[2:]) else key_str_temp.upper()
-                    value = value.strip()
+                        key, _, value = line_content.partition('=')
+                        # 规范化后的键名已全部大写
+                        key = normalize(key.strip())[0]
+                        value = value.strip()
 
-                    if not value:
-                        all_errors.append((file_path, line_num, line_content, "格式错误: 值不能为空"))
-                        continue
+                        if not value:
+                            append_err((file_path, line_num, line_content, "格式错误: 值不能为空"))
+                            continue
                     
-                    is_valid, msg = _validate_key_for_import_optimized(key, version)
-                    if not is_valid:
-                        all_errors.append((file_path, line_num, line_content, msg))
-                        continue
-                        
-                    if key:
-                        is_hash_conversion = False
-                        plaintext_key_for_hash = None
-    
-                        if (version == 'IV' or version == 'WHM') and not key.lower().startswith('0x'):
-                            final_key = f'0x{gta4_gxt_hash(key):08X}'
-                            is_hash_conversion = True
-                            plaintext_key_for_hash = key
-                        else:
-                            final_key = key.upper() if version in ['VC', 'III'] or (version == 'SA' and not key.startswith('0x')) else key
-    
-    
-                        if final_key in data.get(current_table, {}):
-                            msg = f"格式错误: 在表 '{current_table}' 中发现重复的键 '{key}'"
-                            all_errors.append((file_path, line_num, line_content, msg))
+                        is_valid, msg = validate(key, version)
+                        if not is_valid:
+                            append_err((file_path, line_num, line_content, msg))
                             continue
                         
-                        if is_hash_conversion:
-                            if current_table not in hash_tracker:
-                                hash_tracker[current_table] = defaultdict(set)
-                            
-                            hash_tracker[current_table][final_key].add(plaintext_key_for_hash)
-                            
-                            colliding_keys = hash_tracker[current_table][final_key]
-                            if len(colliding_keys) > 1:
-                                colliding_keys_str = ", ".join(f"'{k}'" for k in colliding_keys)
-                                msg = f"严重错误：哈希碰撞！在表 '{current_table}' 中，多个明文键 ({colliding_keys_str}) 均生成了同一个哈希 '{final_key}'"
-                                all_errors.append((file_path, line_num, line_content, msg))
+                        if key:
+                            is_hex = key.startswith(('0x', '0X'))
+                            is_hash_conversion = needs_hash and not is_hex
+                            if is_hash_conversion:
+                                final_key = '0x%08X' % hash_fn(key)
+                            else:
+                                final_key = key if is_hex else sys.intern(key)
+    
+                            if final_key in current_dict:
+                                msg = f"格式错误: 在表 '{current_table}' 中发现重复的键 '{key}'"
+                                append_err((file_path, line_num, line_content, msg))
                                 continue
+                        
+                            if is_hash_conversion:
+                                # 每个哈希只记第一个明文键，碰撞极少见，出现时直接报告两者
+                                table_tracker = hash_tracker.setdefault(current_table, {})
+                                prev_key = table_tracker.setdefault(final_key, key)
+                                if prev_key != key:
+                                    colliding_keys_str = f"'{prev_key}', '{key}'"
+                                    msg = f"严重错误：哈希碰撞！在表 '{current_table}' 中，多个明文键 ({colliding_keys_str}) 均生成了同一个哈希 '{final_key}'"
+                                    append_err((file_path, line_num, line_content, msg))
+                                    continue
     
-                        if ';' in value:
-                            contains_semicolon = True
-                            parts = value.split(';', 1)
-                            original_text = parts[0].strip()
-                            translated_text = parts[1].strip() if len(parts) > 1 else ""
+                            if ';' in value:
+                                contains_semicolon = True
+                                original_text, _, translated_text = value.partition(';')
+                                original_text = original_text.strip()
+                                translated_text = translated_text.strip()
                             
-                            if translated_text:
-                                data[current_table][final_key] = translated_text
-                            else:
-                                data[current_table][final_key] = original_text
+                                current_dict[final_key] = translated_text or original_text
                             
-                            if original_text:
-                                original_data[current_table][final_key] = original_text
-                        else:
-                            data[current_table][final_key] = value
+                                if original_text:
+                                    current_originals[final_key] = original_text
+                            else:
+                                current_dict[final_key] = value
                 
-                else:
-                    all_errors.append((file_path, line_num, line_content, "格式错误: 行既不是表头也不是 'key=value' 格式"))
+                    else:
+                        append_err((file_path, line_num, line_content, "格式错误: 行既不是表头也不是 'key=value' 格式"))
 
         return data, all_errors, original_data, contains_semicolon
 
@@ -4202,49 +4851,21 @@ class GXTEditorApp(QMainWindow):
         if not self.data:
             return ""
     
-        if self.version == 'IV':
-            all_chars = {char for table in self.data.values() for value in table.values() for char in value}
-            special_chars = set()
-            for char in all_chars:
-                if ord(char) > 255:
-                    special_chars.add(char)
-        
-            special_chars.discard(chr(0x2122))
-            special_chars.discard(chr(0x3000))
-            special_chars.discard(chr(0xFEFF))
-        
-        elif self.version == 'VC':
-            all_chars = {char for table in self.data.values() for value in table.values() for char in value}
-            special_chars = set()
-            for char in all_chars:
-                code_point = ord(char)
-                if code_point > 0x7F:
-                    special_chars.add(char)
-                
-        elif self.version == 'SA':
-            all_chars = {char for table in self.data.values() for value in table.values() for char in value}
-            special_chars = set()
-            for char in all_chars:
-                if ord(char) > 0x7F:
-                    special_chars.add(char)
-                
-        elif self.version == 'III':
-            all_chars = {char for table in self.data.values() for value in table.values() for char in value}
-            special_chars = set()
-            for char in all_chars:
-                code_point = ord(char)
-                if code_point >= 0x80:
-                    special_chars.add(char)
-                
+        joined = "".join(value for table in self.data.values() for value in table.values())
+        if not joined:
+            return ""
+        # 整体转为码位数组，去重（结果已排序）后按版本阈值筛选
+        code_points = np.unique(np.frombuffer(joined.encode('utf-32-le', errors='surrogatepass'), dtype='<u4'))
+        
+        if self.version in ('VC', 'SA', 'III'):
+            special = code_points[code_points > 0x7F]
         else:
-            all_chars = {char for table in self.data.values() for value in table.values() for char in value}
-            special_chars = {char for char in all_chars if ord(char) > 255}
-            special_chars.discard(chr(0x2122))
-            special_chars.discard(chr(0x3000))
-            special_chars.discard(chr(0xFEFF))
-    
-        sorted_chars = sorted(special_chars, key=lambda c: ord(c))
-        return "".join(sorted_chars)
+            # IV 及其他版本只收集 255 以上的字符，并排除 ™、全角空格与 BOM
+            special = code_points[code_points > 255]
+            special = special[~np.isin(special, (0x2122, 0x3000, 0xFEFF))]
+        
+        return "".join(map(chr, special.tolist()))
+
     def jump_to_selected_key(self):
         """跳转到选中的键值在原始表中的位置"""
         selected_rows = self.table.selectionModel().selectedRows()
@@ -4257,44 +4878,55 @@ class GXTEditorApp(QMainWindow):
         table_name = None
         key_name = None
         
+        if self.table_model.is_header(row):
+            return
         if self.global_search_button.isChecked():
-            # 全局搜索模式：向上查找表头
-            for i in range(row, -1, -1):
-                if self.table.columnSpan(i, 0) > 1:
-                    header_text = self.table.item(i, 0).text()
-                    table_name = header_text.replace("以下是：", "").replace(" 的键值对", "")
-                    break
-            if table_name:
-                key_name = self.table.item(row, 1).text()
+            # 全局搜索模式：每行都记录了所属表名
+            table_name = self.table_model.table_name_at(row)
         else:
             # 本地搜索模式
             table_name = self.current_table
-            key_name = self.table.item(row, 1).text()
+        key_name = self.table_model.key_at(row)
         
         if not table_name or not key_name:
             return
             
-        # 退出搜索模式
-        if self.global_search_button.isChecked():
-            self.global_search_button.setChecked(False)
-            self._on_search_mode_changed()
-        
-        # 清除搜索框
-        self.key_search.clear()
-        
-        # 选中对应的表
-        items = self.table_list.findItems(table_name, Qt.MatchFlag.MatchExactly)
-        if items:
-            self.table_list.setCurrentItem(items[0])
+        # 以下切换表、清空搜索、选中行只刷新一次表格，中间过程不重绘
+        self.table.setUpdatesEnabled(False)
+        try:
+            # 退出搜索模式
+            if self.global_search_button.isChecked():
+                self.global_search_button.setChecked(False)
+                self.update_status("本地搜索模式")
+            
+            # 清除搜索框，不触发延迟搜索
+            self.key_search.blockSignals(True)
+            self.key_search.clear()
+            self.key_search.blockSignals(False)
+            self._search_timer.stop()
+            
+            # 选中对应的表，屏蔽选择信号，由下面显式调用 select_table 刷新一次
+            items = self.table_list.findItems(table_name, Qt.MatchFlag.MatchExactly)
+            self.table_list.blockSignals(True)
+            try:
+                if items:
+                    self.table_list.setCurrentItem(items[0])
+                else:
+                    self.table_list.clearSelection()
+            finally:
+                self.table_list.blockSignals(False)
             self.select_table()
             
             # 在表中找到对应的键并选中
-            for table_row in range(self.table.rowCount()):
-                if self.table.item(table_row, 1) and self.table.item(table_row, 1).text() == key_name:
+            if items:
+                table_row = self.table_model.key_row(key_name)
+                if table_row >= 0:
+                    self.table_model.ensure_loaded(table_row)
                     self.table.selectRow(table_row)
-                    self.table.scrollToItem(self.table.item(table_row, 0), QAbstractItemView.ScrollHint.PositionAtCenter)
+                    self.table.scrollTo(self.table_model.index(table_row, 0), QAbstractItemView.ScrollHint.PositionAtCenter)
                     self.update_status(f"已跳转到: {table_name} -> {key_name}")
-                    break
+        finally:
+            self.table.setUpdatesEnabled(True)
         
     def open_font_generator(self):
         initial_chars = self.collect_and_filter_chars()
@@ -4374,18 +5006,18 @@ class GXTEditorApp(QMainWindow):
                 command = f'"{python_exe}" "{script_path}" "%1"'
                 icon_path_reg = f'"{python_exe}",0'
 
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\.gxt") as key:
-                winreg.SetValue(key, '', winreg.REG_SZ, 'GXTEditor.File')
-            
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\.gxt2") as key:
-                winreg.SetValue(key, '', winreg.REG_SZ, 'GXTEditor.File')
-            
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\GXTEditor.File") as key:
-                winreg.SetValue(key, '', winreg.REG_SZ, 'GTA文本文件')
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\GXTEditor.File\DefaultIcon") as key:
-                winreg.SetValue(key, '', winreg.REG_SZ, icon_path_reg)
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\GXTEditor.File\shell\open\command") as key:
-                winreg.SetValue(key, '', winreg.REG_SZ, command)
+            associations = (
+                (".gxt", 'GXTEditor.File'),
+                (".gxt2", 'GXTEditor.File'),
+                ("GXTEditor.File", 'GTA文本文件'),
+                (r"GXTEditor.File\DefaultIcon", icon_path_reg),
+                (r"GXTEditor.File\shell\open\command", command),
+            )
+            # 只打开一次 Software\Classes，各子键相对它创建并直接写默认值
+            with winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, r"Software\Classes", 0, winreg.KEY_WRITE) as classes:
+                for sub_key, value in associations:
+                    with winreg.CreateKeyEx(classes, sub_key, 0, winreg.KEY_WRITE) as key:
+                        winreg.SetValueEx(key, '', 0, winreg.REG_SZ, value)
             
             import ctypes
             ctypes.windll.shell32.SHChangeNotify(0x08000000, 0, None, None)
@@ -4412,16 +5044,20 @@ class GXTEditorApp(QMainWindow):
         if self.save_prompt_choice == 'Discard':
             return True
 
-        msg_box = QMessageBox(QMessageBox.Icon.Question, "确认", "文件已被修改，是否保存更改？",
-                             QMessageBox.StandardButton.Save | 
-                             QMessageBox.StandardButton.Discard | 
-                             QMessageBox.StandardButton.Cancel, self)
-        msg_box.button(QMessageBox.StandardButton.Save).setText("保存")
-        msg_box.button(QMessageBox.StandardButton.Discard).setText("不保存")
-        msg_box.button(QMessageBox.StandardButton.Cancel).setText("取消")
-        
-        check_box = QCheckBox("记住我的选择")
-        msg_box.setCheckBox(check_box)
+        msg_box = self._save_prompt_box
+        if msg_box is None:
+            msg_box = QMessageBox(QMessageBox.Icon.Question, "确认", "文件已被修改，是否保存更改？",
+                                 QMessageBox.StandardButton.Save | 
+                                 QMessageBox.StandardButton.Discard | 
+                                 QMessageBox.StandardButton.Cancel, self)
+            msg_box.button(QMessageBox.StandardButton.Save).setText("保存")
+            msg_box.button(QMessageBox.StandardButton.Discard).setText("不保存")
+            msg_box.button(QMessageBox.StandardButton.Cancel).setText("取消")
+            msg_box.setCheckBox(QCheckBox("记住我的选择", msg_box))
+            self._save_prompt_box = msg_box
+        
+        check_box = msg_box.checkBox()
+        check_box.setChecked(False)
         
         reply = msg_box.exec()
         
@@ -4454,30 +5090,32 @@ class GXTEditorApp(QMainWindow):
 
 if __name__ == "__main__":
     import sys
+    multiprocessing.freeze_support()
     QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
     app = QApplication(sys.argv)
 
     translator = QTranslator()
 
-    if getattr(sys, 'frozen', False):
-        base_dir = Path(sys._MEIPASS)
-        custom_trans_path = base_dir / "translations" / "zh_CN.qm"
-        qt_trans_path = base_dir / "translations" / "qt_zh_CN.qm"
-    else:
-        base_dir = Path(__file__).parent
-        custom_trans_path = base_dir / "translations" / "zh_CN.qm"
-        translations_path = QLibraryInfo.path(QLibraryInfo.LibraryPath.TranslationsPath)
-        qt_trans_path = Path(translations_path) / "qt_zh_CN.qm"
+    frozen = getattr(sys, 'frozen', False)
+    base_dir = sys._MEIPASS if frozen else os.path.dirname(__file__)
+    custom_trans_path = os.path.join(base_dir, "translations", "zh_CN.qm")
 
     loaded = False
-    if custom_trans_path.exists() and translator.load(str(custom_trans_path)):
+    if os.path.isfile(custom_trans_path) and translator.load(custom_trans_path):
         app.installTranslator(translator)
         print("✅ 已加载自定义翻译:", custom_trans_path)
         loaded = True
-    elif qt_trans_path.exists() and translator.load(str(qt_trans_path)):
-        app.installTranslator(translator)
-        print("✅ 已加载 Qt 自带中文语言包:", qt_trans_path)
-        loaded = True
+    else:
+        # 只有缺少自定义翻译时才去查询 Qt 自带翻译目录
+        if frozen:
+            qt_trans_dir = os.path.join(base_dir, "translations")
+        else:
+            qt_trans_dir = QLibraryInfo.path(QLibraryInfo.LibraryPath.TranslationsPath)
+        qt_trans_path = os.path.join(qt_trans_dir, "qt_zh_CN.qm")
+        if os.path.isfile(qt_trans_path) and translator.load(qt_trans_path):
+            app.installTranslator(translator)
+            print("✅ 已加载 Qt 自带中文语言包:", qt_trans_path)
+            loaded = True
 
     if not loaded:
         print("⚠️ 未找到任何翻译文件")
@@ -1,6 +1,9 @@
 import os
 import re
 
+# 匹配 "TABLE { ... }" 结构，\w+ 匹配表名
+_TABLE_PATTERN = re.compile(r'(\w+)\s*\{\s*([\s\S]*?)\s*\}')
+
 def convert_oxt_to_txt(file_path):
     """
     将单个 oxt 文件转换为 txt 文件。
@@ -13,56 +16,54 @@ def convert_oxt_to_txt(file_path):
 
     print(f"正在处理: {os.path.basename(file_path)} -> {os.path.basename(output_path)}")
 
+    outfile = None
     try:
         # 使用 'utf-8-sig' 编码读取，它会自动处理并移除BOM
         with open(file_path, 'r', encoding='utf-8-sig') as infile:
-            lines = infile.readlines()
+            # 跳过文件头 (前4行)，只读取剩余内容
+            for _ in range(4):
+                infile.readline()
+            content_str = infile.read()
 
         # 检查文件是否过短
-        if len(lines) < 5:
+        if not content_str:
             print(f"  -> 文件过短，已跳过。")
             return
 
-        # 跳过文件头 (前4行) 并拼接剩余内容
-        content_str = "".join(lines[4:])
-
-        # 使用正则表达式查找所有 "TABLE { ... }" 结构
-        # \w+ 匹配表名
+        # 逐个匹配 "TABLE { ... }" 结构并立即写出
         # [\s\S]*? 非贪婪匹配花括号内的所有内容（包括换行符）
-        pattern = re.compile(r'(\w+)\s*\{\s*([\s\S]*?)\s*\}', re.MULTILINE)
-        matches = pattern.findall(content_str)
-
-        if not matches:
-            print(f"  -> 未找到有效的表结构，已跳过。")
-            return
-            
-        final_output = []
-        # 遍历所有找到的表
-        for table_name, table_content in matches:
-            # 添加表名
-            final_output.append(f"[{table_name}]")
-            
+        for match in _TABLE_PATTERN.finditer(content_str):
+            table_name, table_content = match.groups()
+            block = [f"[{table_name}]"]
             # 处理表内的每一行
-            key_value_lines = table_content.strip().split('\n')
-            for line in key_value_lines:
+            for line in table_content.strip().split('\n'):
                 stripped_line = line.strip()
                 if '=' in stripped_line:
-                    # 分割键和值
-                    key, value = stripped_line.split('=', 1)
-                    # 格式化并去除多余的空格
-                    formatted_line = f"{key.strip()}={value.strip()}"
-                    final_output.append(formatted_line)
-            
+                    # 分割键和值，并去除多余的空格
+                    key, _, value = stripped_line.partition('=')
+                    block.append(f"{key.strip()}={value.strip()}")
             # 在每个表之后加一个空行，让格式更清晰
-            final_output.append('')
+            block.append('')
 
-        # 使用标准的 'utf-8' 编码写入，默认不带BOM
-        with open(output_path, 'w', encoding='utf-8') as outfile:
-            outfile.write('\n'.join(final_output))
-        
+            if outfile is None:
+                # 使用标准的 'utf-8' 编码写入，默认不带BOM
+                outfile = open(output_path, 'w', encoding='utf-8')
+            else:
+                outfile.write('\n')
+            outfile.write('\n'.join(block))
+
+        if outfile is None:
+            print(f"  -> 未找到有效的表结构，已跳过。")
+            return
+
+        outfile.close()
         print(f"  -> 转换成功！")
 
     except Exception as e:
+        # 出错时不留下写了一半的输出文件
+        if outfile is not None:
+            outfile.close()
+            os.remove(output_path)
         print(f"  -> 处理文件时发生错误: {e}")
 
 def main():